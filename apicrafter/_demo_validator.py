@@ -0,0 +1,71 @@
+"""Demo of the request validation engine."""
+
+from .schema_loader import SchemaEndpoint
+from .validator import RequestValidator
+
+
+def demo_validator():
+    """Demo function to show validator functionality."""
+    print("✅ VALIDATION ENGINE DEMO")
+    print("=" * 50)
+
+    validator = RequestValidator()
+
+    # Create a sample endpoint schema
+    endpoint = SchemaEndpoint(
+        method="POST",
+        path="/users",
+        headers={
+            "Authorization": {"type": "string", "required": True},
+            "Content-Type": {"type": "string", "enum": ["application/json"]},
+        },
+        query_params={"validate": {"type": "boolean", "default": False}},
+        body_schema={
+            "type": "object",
+            "properties": {
+                "username": {"type": "string", "minLength": 3},
+                "email": {"type": "string", "pattern": r"^[^@]+@[^@]+\.[^@]+$"},
+                "age": {"type": "integer", "minimum": 0, "maximum": 150},
+            },
+            "required": ["username", "email"],
+        },
+    )
+
+    print("✅ Sample endpoint schema created")
+    print(f"Method: {endpoint.method}")
+    print(f"Path: {endpoint.path}")
+    print(
+        f"Required headers: {[h for h, d in endpoint.headers.items() if d.get('required')]}"
+    )
+    print(f"Required body fields: {endpoint.body_schema.get('required', [])}")
+
+    # Test valid request
+    print("\n🔧 Testing valid request:")
+    valid_headers = {
+        "Authorization": "Bearer token123",
+        "Content-Type": "application/json",
+    }
+    valid_body = {"username": "johndoe", "email": "john@example.com", "age": 25}
+
+    result = validator.validate_request(
+        endpoint=endpoint, headers=valid_headers, body=valid_body, method="POST"
+    )
+
+    print(f"Valid request result: {result.get_summary()}")
+
+    # Test invalid request
+    print("\n🔧 Testing invalid request:")
+    invalid_headers = {"Content-Type": "application/json"}  # Missing Authorization
+    invalid_body = {
+        "username": "jo",
+        "email": "invalid-email",
+    }  # Short username, invalid email
+
+    result = validator.validate_request(
+        endpoint=endpoint, headers=invalid_headers, body=invalid_body, method="POST"
+    )
+
+    print(f"Invalid request result: {result.get_summary()}")
+    print(f"Errors: {len(result.errors)}")
+    for error in result.errors:
+        print(f"  • {error.field}: {error.message}")
@@ -0,0 +1,77 @@
+"""JSON encoding, decoding and file writing shared across modules."""
+
+import json
+import mmap
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# orjson only handles 64-bit integers and reads larger ones back as floats.
+# A run of this many digits might not fit, so such input goes to the stdlib.
+_LONG_DIGITS_RE = re.compile(rb"[0-9]{19}")
+_LONG_DIGITS_TEXT_RE = re.compile(r"[0-9]{19}")
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str, with orjson unless it could lose precision."""
+    if orjson is None:
+        return json.loads(data)
+    long_digits = _LONG_DIGITS_TEXT_RE if isinstance(data, str) else _LONG_DIGITS_RE
+    if long_digits.search(data):
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def load_json_file(path: Path, mmap_threshold: int) -> Any:
+    """Parse a JSON file, memory-mapping files of at least mmap_threshold bytes."""
+    if orjson and path.stat().st_size >= mmap_threshold:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if not _LONG_DIGITS_RE.search(mm):
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+
+    return json_loads(path.read_bytes())
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data as compact JSON bytes."""
+    if orjson:
+        try:
+            return orjson.dumps(data)
+        except TypeError:  # integers beyond 64 bits; the stdlib handles them
+            pass
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def json_dumps_pretty(data: Any) -> bytes:
+    """Serialize data as indented, human-editable JSON bytes."""
+    if orjson:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n"
+        except TypeError:  # integers beyond 64 bits; the stdlib handles them
+            pass
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode()
+
+
+def atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """Write payload to a temp file beside path, fsync it, then rename over path."""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
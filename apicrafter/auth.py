@@ -2,7 +2,7 @@
 
 import base64
 from enum import Enum
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import questionary
 from pydantic import BaseModel
@@ -122,6 +122,22 @@ class AuthHandler:
 
         return None
 
+    @staticmethod
+    def parse_auth_strings(
+        auth_strings: Iterable[str],
+    ) -> List[Optional[AuthConfig]]:
+        """
+        Parse several authentication strings in one call.
+
+        Args:
+            auth_strings: Authentication strings, in any format accepted by
+                parse_auth_string
+
+        Returns:
+            AuthConfig objects (None for invalid strings), in input order
+        """
+        return list(map(AuthHandler.parse_auth_string, auth_strings))
+
     @staticmethod
     def interactive_auth_setup() -> Optional[AuthConfig]:
         """
@@ -100,7 +100,8 @@ class BodyHandler:
             BodyConfig object or None
         """
         if body_string:
-            # Try to parse as JSON first
+            # Try to parse as JSON first. The stdlib parser keeps large
+            # integers exact and accepts NaN and Infinity, unlike orjson.
             try:
                 json_obj = json.loads(body_string)
                 return BodyConfig(body_type=BodyType.JSON, content=json_obj)
@@ -17,7 +17,11 @@ from .http_client import APIClient
 from .interactive import InteractiveSession
 from .renderer import ResponseRenderer
 from .storage import Environment, RequestData, StorageManager
-from .tui import ApiCrafterTUI
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
 
 # Create the main Typer app
 app = typer.Typer(
@@ -168,6 +172,9 @@ def send(
 @app.command()
 def tui() -> None:
     """Launch the Textual User Interface."""
+    # Textual is only imported when the TUI is actually launched
+    from .tui import ApiCrafterTUI
+
     app = ApiCrafterTUI()
     app.run()
 
@@ -446,7 +453,7 @@ def test(
 
             with open(test_path, "r") as f:
                 if tests_file.endswith(".yaml") or tests_file.endswith(".yml"):
-                    test_data = yaml.safe_load(f)
+                    test_data = yaml.load(f, Loader=_Loader)
                 else:
                     test_data = json.load(f)
 
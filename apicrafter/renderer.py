@@ -1,11 +1,11 @@
 """Response rendering and pretty printing using Rich."""
 
 import json
+import re
 import xml.dom.minidom
 from typing import Any, Dict, List, Optional
 
 from rich.console import Console
-from rich.json import JSON
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
@@ -14,6 +14,19 @@ from rich.text import Text
 from .http_client import ResponseData
 from .storage import HistoryEntry
 
+# Resolve the highlighting theme once instead of on every Syntax() call
+_SYNTAX_KWARGS = {
+    "theme": Syntax.get_theme("monokai"),
+    "line_numbers": False,
+    "word_wrap": True,
+}
+
+# Status colors indexed by the hundreds digit of the status code
+_STATUS_COLORS = ("white", "white", "green", "yellow", "red", "bright_red")
+
+# Variable names whose values are masked when listing environments
+_SENSITIVE_RE = re.compile(r"password|secret|key|token", re.IGNORECASE)
+
 
 class ResponseRenderer:
     """Renders HTTP responses with pretty formatting."""
@@ -78,7 +91,7 @@ class ResponseRenderer:
 
         # Try to render as JSON first if it's JSON data
         if response.json_data is not None:
-            self._render_json(response.json_data)
+            self._render_json(response)
         # HTML content
         elif "text/html" in content_type:
             self._render_html(response.text)
@@ -89,32 +102,23 @@ class ResponseRenderer:
         else:
             self._render_text(response.text, content_type)
 
-    def _render_json(self, json_data: Any) -> None:
+    def _render_json(self, response: ResponseData) -> None:
         """Render JSON data with syntax highlighting."""
-        try:
-            json_obj = JSON.from_data(json_data)
-            self.console.print(
-                Panel(json_obj, title="Response Body (JSON)", border_style="green")
-            )
-        except Exception:
-            # Fallback to regular text
-            json_str = json.dumps(json_data, indent=2, ensure_ascii=False)
-            syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
-            self.console.print(
-                Panel(syntax, title="Response Body (JSON)", border_style="green")
-            )
+        # Reuse body text that is already laid out over several lines;
+        # minified bodies (the common case) are indented for display.
+        json_text = response.text
+        if "\n" not in json_text:
+            json_text = json.dumps(response.json_data, indent=2, ensure_ascii=False)
+        syntax = Syntax(json_text, "json", **_SYNTAX_KWARGS)
+        self.console.print(
+            Panel(syntax, title="Response Body (JSON)", border_style="green")
+        )
 
     def _render_html(self, html_content: str) -> None:
         """Render HTML content with syntax highlighting."""
         try:
             # Try to format HTML nicely (basic formatting)
-            syntax = Syntax(
-                html_content,
-                "html",
-                theme="monokai",
-                line_numbers=False,
-                word_wrap=True,
-            )
+            syntax = Syntax(html_content, "html", **_SYNTAX_KWARGS)
             self.console.print(
                 Panel(syntax, title="Response Body (HTML)", border_style="blue")
             )
@@ -133,13 +137,13 @@ class ResponseRenderer:
             lines = [line for line in pretty_xml.split("\n") if line.strip()]
             formatted_xml = "\n".join(lines)
 
-            syntax = Syntax(formatted_xml, "xml", theme="monokai", line_numbers=False)
+            syntax = Syntax(formatted_xml, "xml", **_SYNTAX_KWARGS)
             self.console.print(
                 Panel(syntax, title="Response Body (XML)", border_style="yellow")
             )
         except Exception:
             # Fallback to regular text with XML syntax highlighting
-            syntax = Syntax(xml_content, "xml", theme="monokai", line_numbers=False)
+            syntax = Syntax(xml_content, "xml", **_SYNTAX_KWARGS)
             self.console.print(
                 Panel(syntax, title="Response Body (XML)", border_style="yellow")
             )
@@ -151,13 +155,7 @@ class ResponseRenderer:
 
         if lexer:
             try:
-                syntax = Syntax(
-                    text_content,
-                    lexer,
-                    theme="monokai",
-                    line_numbers=False,
-                    word_wrap=True,
-                )
+                syntax = Syntax(text_content, lexer, **_SYNTAX_KWARGS)
                 self.console.print(
                     Panel(
                         syntax,
@@ -199,16 +197,10 @@ class ResponseRenderer:
 
     def _get_status_color(self, status_code: int) -> str:
         """Get color for HTTP status code."""
-        if 200 <= status_code < 300:
-            return "green"
-        elif 300 <= status_code < 400:
-            return "yellow"
-        elif 400 <= status_code < 500:
-            return "red"
-        elif 500 <= status_code < 600:
-            return "bright_red"
-        else:
-            return "white"
+        bucket = status_code // 100
+        if 0 <= bucket < len(_STATUS_COLORS):
+            return _STATUS_COLORS[bucket]
+        return "white"
 
     def render_history(
         self, history: List[HistoryEntry], limit: Optional[int] = None
@@ -230,20 +222,27 @@ class ResponseRenderer:
 
         entries_to_show = history[-limit:] if limit else history
 
-        for i, entry in enumerate(entries_to_show, 1):
-            status_str = str(entry.status_code) if entry.status_code else "Error"
-            status_color = self._get_status_color(entry.status_code or 0)
-            time_str = f"{entry.response_time:.3f}s" if entry.response_time else "N/A"
-            timestamp_str = entry.timestamp.strftime("%m/%d %H:%M:%S")
+        get_color = self._get_status_color
 
-            table.add_row(
+        def status_cell(status_code: Optional[int]) -> str:
+            color = get_color(status_code or 0)
+            return f"[{color}]{status_code or 'Error'}[/{color}]"
+
+        # Build every row up front, then hand them to the table in one pass
+        rows = [
+            (
                 str(i),
                 entry.method,
                 entry.url,
-                f"[{status_color}]{status_str}[/{status_color}]",
-                time_str,
-                timestamp_str,
+                status_cell(entry.status_code),
+                f"{entry.response_time:.3f}s" if entry.response_time else "N/A",
+                entry.timestamp.strftime("%m/%d %H:%M:%S"),
             )
+            for i, entry in enumerate(entries_to_show, 1)
+        ]
+
+        for row in rows:
+            table.add_row(*row)
 
         self.console.print(table)
 
@@ -290,10 +289,7 @@ class ResponseRenderer:
                 for var_name, var_value in env.variables.items():
                     # Mask sensitive values
                     display_value = var_value
-                    if any(
-                        sensitive in var_name.lower()
-                        for sensitive in ["password", "secret", "key", "token"]
-                    ):
+                    if _SENSITIVE_RE.search(var_name):
                         display_value = "*" * len(var_value) if var_value else ""
 
                     table.add_row(var_name, display_value)
@@ -1,18 +1,33 @@
 """Schema loader for OpenAPI and JSON schemas."""
 
+import functools
 import json
 import logging
-import os
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 import httpx
 import yaml
-from pydantic import BaseModel
-
+from pydantic import (
+    BaseModel,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
+
+from ._json import atomic_write_bytes, json_dumps, json_loads
 from .storage import StorageManager
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+# OpenAPI path item keys that describe operations
+_HTTP_METHODS = frozenset(("get", "post", "put", "patch", "delete", "head", "options"))
+
 
 class SchemaEndpoint(BaseModel):
     """Model for an API endpoint schema."""
@@ -27,9 +42,144 @@ class SchemaEndpoint(BaseModel):
     auth_schema: Optional[Dict[str, Any]] = None
     responses: Dict[str, Any] = {}
 
+    # Set by RequestValidator.compile_validator on first validation
+    _compiled_validator: Optional[Any] = PrivateAttr(default=None)
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        # The compiled validator is built from closures and cannot be
+        # pickled; it is recompiled on the next validation
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private and private.get("_compiled_validator") is not None:
+            state["__pydantic_private__"] = {**private, "_compiled_validator": None}
+        return state
+
+    @functools.cached_property
+    def required_headers(self) -> Tuple[str, ...]:
+        """Names of required headers, in schema order."""
+        return tuple(
+            name
+            for name, header_def in self.headers.items()
+            if header_def.get("required")
+        )
+
+    @functools.cached_property
+    def required_body_fields(self) -> Tuple[str, ...]:
+        """Required top-level body properties, in schema order."""
+        required = (self.body_schema or {}).get("required")
+        # A bare boolean marks the body itself as required
+        return tuple(required) if isinstance(required, list) else ()
+
+
+def _parse_endpoint(
+    path: str,
+    method: str,
+    method_data: Dict[str, Any],
+    components: Dict[str, Any],
+) -> SchemaEndpoint:
+    """Parse individual endpoint from OpenAPI spec."""
+    endpoint = SchemaEndpoint.model_construct(
+        method=method,
+        path=path,
+        summary=method_data.get("summary"),
+        description=method_data.get("description"),
+        headers={},
+        query_params={},
+        body_schema=None,
+        auth_schema=None,
+        responses={},
+    )
+
+    # Parse parameters (headers and query)
+    parameters = method_data.get("parameters", [])
+
+    for param in parameters:
+        param_name = param.get("name")
+        param_in = param.get("in")
+        param_schema = param.get("schema", {})
+        param_required = param.get("required", False)
+        param_description = param.get("description", "")
+
+        param_def = {
+            "type": param_schema.get("type", "string"),
+            "required": param_required,
+            "description": param_description,
+            "default": param_schema.get("default"),
+            "enum": param_schema.get("enum"),
+            "example": param.get("example") or param_schema.get("example"),
+        }
+
+        if param_in == "header":
+            endpoint.headers[param_name] = param_def
+        elif param_in == "query":
+            endpoint.query_params[param_name] = param_def
+
+    # Parse request body
+    request_body = method_data.get("requestBody", {})
+    if request_body:
+        content = request_body.get("content", {})
+
+        # Try JSON first, then form data
+        for content_type in [
+            "application/json",
+            "application/x-www-form-urlencoded",
+            "multipart/form-data",
+        ]:
+            if content_type in content:
+                schema = content[content_type].get("schema", {})
+                endpoint.body_schema = _resolve_schema_ref(schema, components)
+                break
+
+    # Parse security requirements
+    security = method_data.get("security", [])
+    if security:
+        # Take the first security requirement
+        first_security = security[0]
+        for scheme_name in first_security.keys():
+            endpoint.auth_schema = {
+                "scheme": scheme_name,
+                "type": "bearer",  # Default, will be refined based on security scheme
+            }
+            break
+
+    # Parse responses
+    responses = method_data.get("responses", {})
+    endpoint.responses = responses
+
+    return endpoint
+
+
+def _resolve_schema_ref(
+    schema: Dict[str, Any], components: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Resolve $ref references in schema."""
+    if "$ref" in schema:
+        ref_path = schema["$ref"]
+        if ref_path.startswith("#/components/schemas/"):
+            schema_name = ref_path.split("/")[-1]
+            return components.get("schemas", {}).get(schema_name, {})
+
+    # Recursively resolve refs in properties
+    if "properties" in schema:
+        resolved_properties = {}
+        for prop_name, prop_schema in schema["properties"].items():
+            resolved_properties[prop_name] = _resolve_schema_ref(
+                prop_schema, components
+            )
+        schema = schema.copy()
+        schema["properties"] = resolved_properties
+
+    return schema
+
 
 class APISchema(BaseModel):
-    """Model for complete API schema."""
+    """
+    Model for complete API schema.
+
+    Schemas parsed by SchemaLoader keep the raw OpenAPI operations and only
+    build SchemaEndpoint objects when they are looked up. The full
+    ``endpoints`` list is built the first time it is read.
+    """
 
     title: str = "API"
     version: str = "1.0.0"
@@ -38,6 +188,71 @@ class APISchema(BaseModel):
     components: Dict[str, Any] = {}
     security_schemes: Dict[str, Any] = {}
 
+    # path -> METHOD -> raw OpenAPI operation data
+    _raw_paths: Dict[str, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+    # (METHOD, path) -> parsed endpoint
+    _endpoint_cache: Dict[Tuple[str, str], SchemaEndpoint] = PrivateAttr(
+        default_factory=dict
+    )
+    # (METHOD, number of path segments) -> schema paths, built on first
+    # path-parameter lookup
+    _path_index: Optional[Dict[Tuple[str, int], List[str]]] = PrivateAttr(default=None)
+    # False until endpoints holds every operation in _raw_paths
+    _endpoints_built: bool = PrivateAttr(default=True)
+
+    def __getattribute__(self, name: str) -> Any:
+        # Parsed schemas build their endpoint list the first time it is read
+        if name == "endpoints":
+            object.__getattribute__(self, "_build_endpoints")()
+        return super().__getattribute__(name)
+
+    def _build_endpoints(self) -> None:
+        """Parse every remaining operation into the endpoints list."""
+        if self._endpoints_built:
+            return
+        self.__dict__["endpoints"] = [
+            self._parsed_endpoint(method, path)
+            for path, operations in self._raw_paths.items()
+            for method in operations
+        ]
+        self._endpoints_built = True
+
+    def _parsed_endpoint(self, method: str, path: str) -> SchemaEndpoint:
+        """Parse an endpoint from the raw schema on first access."""
+        key = (method, path)
+        endpoint = self._endpoint_cache.get(key)
+
+        if endpoint is None:
+            endpoint = _parse_endpoint(
+                path, method, self._raw_paths[path][method], self.components
+            )
+            self._endpoint_cache[key] = endpoint
+
+        return endpoint
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        # Build lazy endpoints first so they are included
+        self._build_endpoints()
+        return handler(self)
+
+    def __eq__(self, other: Any) -> bool:
+        # Copies, pickles and comparisons all see the fully built endpoints
+        if not isinstance(other, APISchema):
+            return NotImplemented
+        self._build_endpoints()
+        other._build_endpoints()
+        # Fields only: the private lookup caches depend on access history
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "APISchema":
+        self._build_endpoints()
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        self._build_endpoints()
+        return super().__getstate__()
+
 
 class SchemaLoader:
     """Loads and parses API schemas from various sources."""
@@ -48,6 +263,9 @@ class SchemaLoader:
         self.cache_dir = self.storage.config_dir / "schema_cache"
         self.cache_dir.mkdir(exist_ok=True)
 
+        # resolved file path -> (mtime_ns, size, schema parsed from it)
+        self._file_schemas: Dict[str, Tuple[int, int, APISchema]] = {}
+
     def load_schema_from_url(self, base_url: str) -> Optional[APISchema]:
         """
         Fetch OpenAPI schema from URL.
@@ -88,7 +306,7 @@ class SchemaLoader:
                     response = client.get(url)
 
                     if response.status_code == 200:
-                        schema_data = response.json()
+                        schema_data = json_loads(response.content)
                         api_schema = self._parse_openapi_schema(schema_data, base_url)
 
                         # Cache the schema
@@ -111,6 +329,10 @@ class SchemaLoader:
         """
         Load schema from local YAML/JSON file.
 
+        The parsed schema is reused until the file's modification time or
+        size changes, so repeated loads of the same file return the same
+        APISchema object.
+
         Args:
             file_path: Path to schema file
 
@@ -123,9 +345,19 @@ class SchemaLoader:
                 logging.error(f"Schema file not found: {file_path}")
                 return None
 
+            key = str(path.resolve())
+            stat = path.stat()
+            cached = self._file_schemas.get(key)
+            if (
+                cached is not None
+                and cached[0] == stat.st_mtime_ns
+                and cached[1] == stat.st_size
+            ):
+                return cached[2]
+
             with open(path, "r", encoding="utf-8") as f:
                 if path.suffix.lower() in [".yaml", ".yml"]:
-                    schema_data = yaml.safe_load(f)
+                    schema_data = yaml.load(f, Loader=_Loader)
                 else:
                     schema_data = json.load(f)
 
@@ -134,7 +366,9 @@ class SchemaLoader:
                 "url", "https://api.example.com"
             )
 
-            return self._parse_openapi_schema(schema_data, base_url)
+            api_schema = self._parse_openapi_schema(schema_data, base_url)
+            self._file_schemas[key] = (stat.st_mtime_ns, stat.st_size, api_schema)
+            return api_schema
 
         except Exception as e:
             logging.error(f"Failed to load schema from file {file_path}: {e}")
@@ -156,19 +390,76 @@ class SchemaLoader:
         """
         method = method.upper()
 
+        if schema._raw_paths:
+            # Exact path first, then fall back to path-parameter matching
+            if method in schema._raw_paths.get(path, {}):
+                return self._get_parsed_endpoint(schema, method, path)
+
+            # Only paths with the same number of segments can match
+            index = schema._path_index
+            if index is None:
+                index = schema._path_index = self._build_path_index(schema)
+            candidates = index.get((method, len(path.strip("/").split("/"))), ())
+            for schema_path in candidates:
+                if self._path_matches(schema_path, path):
+                    return self._get_parsed_endpoint(schema, method, schema_path)
+
+            return None
+
         for endpoint in schema.endpoints:
             if endpoint.method == method and self._path_matches(endpoint.path, path):
                 return endpoint
 
         return None
 
+    def get_endpoints(self, schema: APISchema) -> List[SchemaEndpoint]:
+        """
+        Get all endpoints in schema, parsing any that have not been parsed yet.
+
+        Equivalent to reading schema.endpoints.
+
+        Args:
+            schema: APISchema object
+
+        Returns:
+            List of SchemaEndpoint objects
+        """
+        return schema.endpoints
+
+    def _get_parsed_endpoint(
+        self, schema: APISchema, method: str, path: str
+    ) -> SchemaEndpoint:
+        """Parse an endpoint from the raw schema on first access."""
+        return schema._parsed_endpoint(method, path)
+
+    def _build_path_index(self, schema: APISchema) -> Dict[Tuple[str, int], List[str]]:
+        """Group raw schema paths by method and segment count, in schema order."""
+        index: Dict[Tuple[str, int], List[str]] = {}
+        for schema_path, operations in schema._raw_paths.items():
+            segments = len(schema_path.strip("/").split("/"))
+            for method in operations:
+                index.setdefault((method, segments), []).append(schema_path)
+        return index
+
+    def _operation_keys(self, schema: APISchema) -> List[Tuple[str, str]]:
+        """Get (method, path) pairs for all operations without parsing them."""
+        if schema._raw_paths:
+            return [
+                (method, path)
+                for path, operations in schema._raw_paths.items()
+                for method in operations
+            ]
+
+        return [(endpoint.method, endpoint.path) for endpoint in schema.endpoints]
+
     def _parse_openapi_schema(
         self, schema_data: Dict[str, Any], base_url: str
     ) -> APISchema:
         """Parse OpenAPI schema into our internal format."""
         info = schema_data.get("info", {})
 
-        api_schema = APISchema(
+        # Parsed schema data is trusted, so skip pydantic validation here.
+        api_schema = APISchema.model_construct(
             title=info.get("title", "API"),
             version=info.get("version", "1.0.0"),
             base_url=base_url,
@@ -178,121 +469,23 @@ class SchemaLoader:
             ),
         )
 
-        # Parse paths
+        # Index operations by path and method; endpoints are parsed on demand,
+        # and the endpoint list is built the first time it is read
+        api_schema._endpoints_built = False
+
         paths = schema_data.get("paths", {})
 
         for path, path_data in paths.items():
+            operations = {}
             for method, method_data in path_data.items():
-                if method.lower() in [
-                    "get",
-                    "post",
-                    "put",
-                    "patch",
-                    "delete",
-                    "head",
-                    "options",
-                ]:
-                    endpoint = self._parse_endpoint(
-                        path, method.upper(), method_data, api_schema.components
-                    )
-                    api_schema.endpoints.append(endpoint)
+                method_lower = method.lower()
+                if method_lower in _HTTP_METHODS:
+                    operations[method_lower.upper()] = method_data
 
-        return api_schema
-
-    def _parse_endpoint(
-        self,
-        path: str,
-        method: str,
-        method_data: Dict[str, Any],
-        components: Dict[str, Any],
-    ) -> SchemaEndpoint:
-        """Parse individual endpoint from OpenAPI spec."""
-        endpoint = SchemaEndpoint(
-            method=method,
-            path=path,
-            summary=method_data.get("summary"),
-            description=method_data.get("description"),
-        )
-
-        # Parse parameters (headers and query)
-        parameters = method_data.get("parameters", [])
-
-        for param in parameters:
-            param_name = param.get("name")
-            param_in = param.get("in")
-            param_schema = param.get("schema", {})
-            param_required = param.get("required", False)
-            param_description = param.get("description", "")
-
-            param_def = {
-                "type": param_schema.get("type", "string"),
-                "required": param_required,
-                "description": param_description,
-                "default": param_schema.get("default"),
-                "enum": param_schema.get("enum"),
-                "example": param.get("example") or param_schema.get("example"),
-            }
-
-            if param_in == "header":
-                endpoint.headers[param_name] = param_def
-            elif param_in == "query":
-                endpoint.query_params[param_name] = param_def
-
-        # Parse request body
-        request_body = method_data.get("requestBody", {})
-        if request_body:
-            content = request_body.get("content", {})
-
-            # Try JSON first, then form data
-            for content_type in [
-                "application/json",
-                "application/x-www-form-urlencoded",
-                "multipart/form-data",
-            ]:
-                if content_type in content:
-                    schema = content[content_type].get("schema", {})
-                    endpoint.body_schema = self._resolve_schema_ref(schema, components)
-                    break
-
-        # Parse security requirements
-        security = method_data.get("security", [])
-        if security:
-            # Take the first security requirement
-            first_security = security[0]
-            for scheme_name in first_security.keys():
-                endpoint.auth_schema = {
-                    "scheme": scheme_name,
-                    "type": "bearer",  # Default, will be refined based on security scheme
-                }
-                break
-
-        # Parse responses
-        responses = method_data.get("responses", {})
-        endpoint.responses = responses
-
-        return endpoint
+            if operations:
+                api_schema._raw_paths[path] = operations
 
-    def _resolve_schema_ref(
-        self, schema: Dict[str, Any], components: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Resolve $ref references in schema."""
-        if "$ref" in schema:
-            ref_path = schema["$ref"]
-            if ref_path.startswith("#/components/schemas/"):
-                schema_name = ref_path.split("/")[-1]
-                return components.get("schemas", {}).get(schema_name, {})
-
-        # Recursively resolve refs in properties
-        if "properties" in schema:
-            resolved_properties = {}
-            for prop_name, prop_schema in schema["properties"].items():
-                resolved_properties[prop_name] = self._resolve_schema_ref(
-                    prop_schema, components
-                )
-            schema = schema.copy()
-            schema["properties"] = resolved_properties
-
-        return schema
+        return api_schema
 
     def _path_matches(self, schema_path: str, request_path: str) -> bool:
         """Check if request path matches schema path (with path parameters)."""
@@ -323,11 +516,12 @@ class SchemaLoader:
             cache_entry = {
                 "url": base_url,
                 "schema": schema_data,
-                "cached_at": str(Path().cwd()),  # Simple timestamp
+                "cached_at": time.time(),
             }
 
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_entry, f, indent=2)
+            # A unique temp file per write, so concurrent processes never
+            # interleave before the atomic swap
+            atomic_write_bytes(cache_file, json_dumps(cache_entry))
 
             logging.info(f"Cached schema for {base_url}")
 
@@ -341,8 +535,7 @@ class SchemaLoader:
             cache_file = self.cache_dir / f"schema_{url_hash}.json"
 
             if cache_file.exists():
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    cache_entry = json.load(f)
+                cache_entry = json_loads(cache_file.read_bytes())
 
                 if cache_entry.get("url") == base_url:
                     logging.info(f"Using cached schema for {base_url}")
@@ -368,24 +561,25 @@ class SchemaLoader:
         """
         endpoints = []
 
-        for endpoint in schema.endpoints:
-            if filter_method is None or endpoint.method == filter_method.upper():
-                endpoints.append((endpoint.method, endpoint.path))
+        for method, path in self._operation_keys(schema):
+            if filter_method is None or method == filter_method.upper():
+                endpoints.append((method, path))
 
         return sorted(endpoints)
 
     def get_schema_summary(self, schema: APISchema) -> Dict[str, Any]:
         """Get summary information about the schema."""
         method_counts = {}
+        operations = self._operation_keys(schema)
 
-        for endpoint in schema.endpoints:
-            method_counts[endpoint.method] = method_counts.get(endpoint.method, 0) + 1
+        for method, _ in operations:
+            method_counts[method] = method_counts.get(method, 0) + 1
 
         return {
             "title": schema.title,
             "version": schema.version,
             "base_url": schema.base_url,
-            "total_endpoints": len(schema.endpoints),
+            "total_endpoints": len(operations),
             "methods": method_counts,
             "has_auth": bool(schema.security_schemes),
         }
@@ -450,10 +644,11 @@ def demo_schema_loader():
     print(f"Title: {api_schema.title}")
     print(f"Version: {api_schema.version}")
     print(f"Base URL: {api_schema.base_url}")
-    print(f"Endpoints: {len(api_schema.endpoints)}")
+    endpoints = loader.get_endpoints(api_schema)
+    print(f"Endpoints: {len(endpoints)}")
 
     print("\n🔧 Endpoints:")
-    for endpoint in api_schema.endpoints:
+    for endpoint in endpoints:
         print(f"  {endpoint.method} {endpoint.path}")
         if endpoint.summary:
             print(f"    Summary: {endpoint.summary}")
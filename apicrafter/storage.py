@@ -1,15 +1,73 @@
 """Storage management for collections, environments, and history."""
 
-import json
+import atexit
+import functools
 import logging
+import mmap
 import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 from pydantic import BaseModel, Field
 
+from ._json import (
+    atomic_write_bytes,
+    json_dumps,
+    json_dumps_pretty,
+    json_loads,
+    load_json_file,
+)
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+
+def _variable_substituter(variables: Dict[str, str]) -> Callable[[str], str]:
+    """Build a function that fills {{VAR}} placeholders from variables."""
+    lookup = variables.get
+
+    def replace(match: "re.Match[str]") -> str:
+        # Unknown names are left in place, braces included
+        return lookup(match.group(1), match.group(0))
+
+    return functools.partial(_VARIABLE_RE.sub, replace)
+
+
+# Contents of freshly created storage files, pre-rendered as json_dumps_pretty would
+_DEFAULT_COLLECTIONS = b'{\n  "collections": {}\n}\n'
+_DEFAULT_ENVIRONMENTS = (
+    b'{\n  "environments": {\n    "default": {\n'
+    b'      "name": "default",\n      "variables": {}\n    }\n  }\n}\n'
+)
+
+# With a write delay, history entries are appended in batches of at most this
+_HISTORY_FLUSH_ENTRIES = 16
+
+# History is rotated past this size; the newest part stays in the live log
+_HISTORY_MAX_BYTES = 8 * 1024 * 1024
+_HISTORY_KEEP_BYTES = 4 * 1024 * 1024
+_HISTORY_GENERATIONS = 3
+
+# Resolved templates remembered per environment
+_RESOLVED_CACHE_SIZE = 256
+
+# {{VAR}} placeholders; names are looked up at substitution time, so one
+# pattern serves every environment
+_VARIABLE_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
+# Files at least this large are memory-mapped instead of read into memory
+_MMAP_THRESHOLD = 64 * 1024
+
 
 class RequestData(BaseModel):
     """Model for storing request data."""
@@ -22,6 +80,17 @@ class RequestData(BaseModel):
     json_data: Optional[Dict[str, Any]] = None
 
 
+# Field names compared by _dump_is_current
+_REQUEST_FIELDS = tuple(RequestData.model_fields)
+
+
+def _dump_is_current(request: RequestData, dumped: Dict[str, Any]) -> bool:
+    """Whether a cached dump still matches a request that may have been edited."""
+    # Plain equality walks the values in C, much cheaper than re-dumping
+    values = request.__dict__
+    return all(values.get(name) == dumped.get(name) for name in _REQUEST_FIELDS)
+
+
 class Collection(BaseModel):
     """Model for a collection of requests."""
 
@@ -51,16 +120,53 @@ class HistoryEntry(BaseModel):
 class StorageManager:
     """Manages storage of collections, environments, and history."""
 
-    def __init__(self, config_dir: Optional[Path] = None):
-        """Initialize storage manager."""
+    def __init__(self, config_dir: Optional[Path] = None, write_delay: float = 0.0):
+        """
+        Initialize storage manager.
+
+        Args:
+            config_dir: Directory holding the storage files
+            write_delay: Seconds to coalesce collection and history writes
+                before flushing them to disk (0 writes immediately)
+        """
         if config_dir is None:
             config_dir = Path.home() / ".apicrafter"
 
         self.config_dir = config_dir
-        self.collections_file = config_dir / "collections.yaml"
-        self.environments_file = config_dir / "envs.yaml"
+        self.write_delay = write_delay
+        self.collections_file = config_dir / "collections.json"
+        self.environments_file = config_dir / "envs.json"
         self.history_file = config_dir / "history.log"
 
+        # Parsed file contents, reused until the file's mtime changes
+        self._collections_cache: Optional[Dict[str, Collection]] = None
+        self._collections_data: Optional[Dict[str, Any]] = None
+        self._collections_mtime: Optional[int] = None
+        self._collections_dirty = False
+        self._environments_cache: Optional[Dict[str, Environment]] = None
+        self._environments_mtime: Optional[int] = None
+
+        # Bumped whenever cached collections change, so callers can drop
+        # anything they derived from them
+        self.collections_version = 0
+
+        # id(request) -> (request, serialized dict), reused by _save_collections
+        self._request_dumps: Dict[int, Tuple[RequestData, Dict[str, Any]]] = {}
+
+        # env name -> (substituter, LRU of template -> resolved text); built
+        # from the cached environments and dropped whenever those change
+        self._resolved_templates: Dict[
+            str, Tuple[Callable[[str], str], "OrderedDict[str, str]"]
+        ] = {}
+
+        # Serialized history lines waiting to be appended
+        self._history_buffer: List[bytes] = []
+
+        # Delayed flush of pending writes (only used when write_delay > 0)
+        self._flush_lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_deadline = 0.0
+
         # Create config directory if it doesn't exist
         self.config_dir.mkdir(exist_ok=True)
 
@@ -70,35 +176,69 @@ class StorageManager:
     def _init_files(self) -> None:
         """Initialize configuration files if they don't exist."""
         if not self.collections_file.exists():
-            self.collections_file.write_text("collections: {}\n")
+            self._create_storage_file(self.collections_file, _DEFAULT_COLLECTIONS)
 
         if not self.environments_file.exists():
-            default_env = {
-                "environments": {"default": {"name": "default", "variables": {}}}
-            }
-            with open(self.environments_file, "w") as f:
-                yaml.dump(default_env, f, default_flow_style=False)
+            self._create_storage_file(self.environments_file, _DEFAULT_ENVIRONMENTS)
 
         if not self.history_file.exists():
             self.history_file.touch()
 
+    def _create_storage_file(self, json_file: Path, default: bytes) -> None:
+        """Create a JSON storage file, migrating a legacy YAML file if present."""
+        content = default
+        legacy_file = json_file.with_suffix(".yaml")
+
+        if legacy_file.exists():
+            try:
+                with open(legacy_file, "r") as f:
+                    data = yaml.load(f, Loader=_Loader)
+                if data:
+                    content = json_dumps_pretty(data)
+                logging.info(f"Migrated {legacy_file} to {json_file}")
+            except Exception as e:
+                # Writing the default would shadow the legacy data for good
+                logging.error(f"Error migrating {legacy_file}: {e}")
+                raise
+
+        # A half-written file would block migration from ever being retried
+        atomic_write_bytes(json_file, content)
+
     def save_request(
         self, name: str, request_data: RequestData, collection: str = "default"
     ) -> None:
         """Save a request to a collection."""
-        collections = self.load_collections()
+        collections = self._cached_collections()
 
         if collection not in collections:
             collections[collection] = Collection(name=collection)
 
+        replaced = collections[collection].requests.get(name)
+        if replaced is not None:
+            self._request_dumps.pop(id(replaced), None)
         collections[collection].requests[name] = request_data
-        self._save_collections(collections)
+        self.collections_version += 1
+
+        data = self._collections_data
+        if data is None:
+            self._save_collections(collections)
+            return
+
+        # Only the saved request is serialized; the rest of the file data is reused
+        with self._flush_lock:
+            coll_data = data.setdefault("collections", {}).setdefault(
+                collection, {"name": collection, "requests": {}}
+            )
+            coll_data.setdefault("requests", {})[name] = self._dump_request(
+                request_data
+            )
+            self._write_collections_data(data)
 
     def load_request(
         self, name: str, collection: str = "default"
     ) -> Optional[RequestData]:
         """Load a request from a collection."""
-        collections = self.load_collections()
+        collections = self._cached_collections()
 
         if collection in collections and name in collections[collection].requests:
             return collections[collection].requests[name]
@@ -106,16 +246,33 @@ class StorageManager:
         return None
 
     def load_collections(self) -> Dict[str, Collection]:
-        """Load all collections."""
+        """Load all collections; the result may be modified freely."""
+        # Copy down to each request mapping so callers cannot change the cache
+        return {
+            name: collection.model_copy(update={"requests": dict(collection.requests)})
+            for name, collection in self._cached_collections().items()
+        }
+
+    def _cached_collections(self) -> Dict[str, Collection]:
+        """Get the parsed collections, re-reading the file if it changed."""
         try:
-            with open(self.collections_file, "r") as f:
-                data = yaml.safe_load(f) or {}
+            mtime = self.collections_file.stat().st_mtime_ns
+            if self._collections_cache is not None and (
+                self._collections_dirty or mtime == self._collections_mtime
+            ):
+                return self._collections_cache
+
+            data = load_json_file(self.collections_file, _MMAP_THRESHOLD) or {}
 
+            # The file is user-editable, so validate it like any other input
             collections = {}
+            request_dumps = {}
             for coll_name, coll_data in data.get("collections", {}).items():
                 requests = {}
                 for req_name, req_data in coll_data.get("requests", {}).items():
-                    requests[req_name] = RequestData(**req_data)
+                    request = RequestData.model_validate(req_data)
+                    requests[req_name] = request
+                    request_dumps[id(request)] = (request, req_data)
 
                 collections[coll_name] = Collection(
                     name=coll_name,
@@ -123,6 +280,11 @@ class StorageManager:
                     description=coll_data.get("description"),
                 )
 
+            self._collections_cache = collections
+            self.collections_version += 1
+            self._collections_data = data
+            self._collections_mtime = mtime
+            self._request_dumps = request_dumps
             return collections
         except Exception as e:
             logging.error(f"Error loading collections: {e}")
@@ -131,11 +293,22 @@ class StorageManager:
     def _save_collections(self, collections: Dict[str, Collection]) -> None:
         """Save collections to file."""
         data = {"collections": {}}
+        previous_dumps = self._request_dumps
+        self._request_dumps = {}
 
         for coll_name, collection in collections.items():
             requests_data = {}
             for req_name, request in collection.requests.items():
-                requests_data[req_name] = request.model_dump(exclude_none=True)
+                cached = previous_dumps.get(id(request))
+                if (
+                    cached is not None
+                    and cached[0] is request
+                    and _dump_is_current(request, cached[1])
+                ):
+                    self._request_dumps[id(request)] = cached
+                    requests_data[req_name] = cached[1]
+                else:
+                    requests_data[req_name] = self._dump_request(request)
 
             data["collections"][coll_name] = {
                 "name": collection.name,
@@ -145,8 +318,39 @@ class StorageManager:
             if collection.description:
                 data["collections"][coll_name]["description"] = collection.description
 
-        with open(self.collections_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        self._write_collections_data(data)
+        self._collections_cache = collections
+        self.collections_version += 1
+
+    def _dump_request(self, request: RequestData) -> Dict[str, Any]:
+        """Serialize a request, remembering the result for later full saves."""
+        cached = self._request_dumps.get(id(request))
+        if (
+            cached is not None
+            and cached[0] is request
+            and _dump_is_current(request, cached[1])
+        ):
+            return cached[1]
+
+        dumped = request.model_dump(exclude_none=True)
+        self._request_dumps[id(request)] = (request, dumped)
+        return dumped
+
+    def _write_collections_data(self, data: Dict[str, Any]) -> None:
+        """Write collections data now, or schedule it when writes are delayed."""
+        if self.write_delay > 0:
+            with self._flush_lock:
+                self._collections_data = data
+                self._collections_dirty = True
+            self._schedule_flush()
+        else:
+            self._write_collections_file(data)
+
+    def _write_collections_file(self, data: Dict[str, Any]) -> None:
+        """Atomically replace the collections file with serialized data."""
+        atomic_write_bytes(self.collections_file, json_dumps_pretty(data))
+        self._collections_data = data
+        self._collections_mtime = self.collections_file.stat().st_mtime_ns
 
     def save_environment(self, env: Environment) -> None:
         """Save an environment."""
@@ -156,14 +360,29 @@ class StorageManager:
 
     def load_environment(self, name: str) -> Optional[Environment]:
         """Load an environment by name."""
-        environments = self.load_environments()
-        return environments.get(name)
+        env = self._cached_environments().get(name)
+        if env is None:
+            return None
+        return env.model_copy(update={"variables": dict(env.variables)})
 
     def load_environments(self) -> Dict[str, Environment]:
-        """Load all environments."""
+        """Load all environments; the result may be modified freely."""
+        return {
+            name: env.model_copy(update={"variables": dict(env.variables)})
+            for name, env in self._cached_environments().items()
+        }
+
+    def _cached_environments(self) -> Dict[str, Environment]:
+        """Get the parsed environments, re-reading the file if it changed."""
         try:
-            with open(self.environments_file, "r") as f:
-                data = yaml.safe_load(f) or {}
+            mtime = self.environments_file.stat().st_mtime_ns
+            if (
+                self._environments_cache is not None
+                and mtime == self._environments_mtime
+            ):
+                return self._environments_cache
+
+            data = load_json_file(self.environments_file, _MMAP_THRESHOLD) or {}
 
             environments = {}
             for env_name, env_data in data.get("environments", {}).items():
@@ -171,6 +390,9 @@ class StorageManager:
                     name=env_name, variables=env_data.get("variables", {})
                 )
 
+            self._environments_cache = environments
+            self._environments_mtime = mtime
+            self._resolved_templates.clear()
             return environments
         except Exception as e:
             logging.error(f"Error loading environments: {e}")
@@ -179,55 +401,194 @@ class StorageManager:
     def _save_environments(self, environments: Dict[str, Environment]) -> None:
         """Save environments to file."""
         data = {"environments": {}}
+        # Cache copies, so the caller's objects do not alias the cache
+        cache = {}
 
         for env_name, env in environments.items():
+            variables = dict(env.variables)
             data["environments"][env_name] = {
                 "name": env.name,
-                "variables": env.variables,
+                "variables": variables,
             }
+            cache[env_name] = env.model_copy(update={"variables": variables})
+
+        atomic_write_bytes(self.environments_file, json_dumps_pretty(data))
 
-        with open(self.environments_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        self._environments_cache = cache
+        self._resolved_templates.clear()
+        self._environments_mtime = self.environments_file.stat().st_mtime_ns
 
     def add_to_history(self, entry: HistoryEntry) -> None:
         """Add an entry to request history."""
+        # mode="json" already renders the timestamp as an ISO string
+        line = json_dumps(entry.model_dump(mode="json")) + b"\n"
+
+        with self._flush_lock:
+            self._history_buffer.append(line)
+            pending = len(self._history_buffer)
+
+        # Without a write delay every entry is on disk when this returns
+        if self.write_delay > 0 and pending < _HISTORY_FLUSH_ENTRIES:
+            self._schedule_flush()
+        else:
+            self.flush_history()
+
+    def flush_history(self) -> None:
+        """Append buffered history entries to the history file."""
+        with self._flush_lock:
+            if not self._history_buffer:
+                return
+
+            try:
+                # One O_APPEND write per batch keeps entries whole and ordered
+                payload = memoryview(b"".join(self._history_buffer))
+                fd = os.open(
+                    self.history_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+                )
+                try:
+                    while payload:
+                        payload = payload[os.write(fd, payload) :]
+                finally:
+                    os.close(fd)
+                self._history_buffer.clear()
+
+                if self.history_file.stat().st_size > _HISTORY_MAX_BYTES:
+                    self._rotate_history()
+            except Exception as e:
+                logging.error(f"Error saving to history: {e}")
+
+    def _rotate_history(self) -> None:
+        """Archive the history log and restart it from its most recent entries."""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.config_dir, prefix=".history.", suffix=".tmp"
+        )
         try:
-            with open(self.history_file, "a") as f:
-                f.write(json.dumps(entry.model_dump(), default=str) + "\n")
-        except Exception as e:
-            logging.error(f"Error saving to history: {e}")
+            # Copy only the tail, starting at the first complete line
+            with open(self.history_file, "rb") as src, os.fdopen(fd, "wb") as dst:
+                src.seek(max(0, os.fstat(src.fileno()).st_size - _HISTORY_KEEP_BYTES))
+                if src.tell():
+                    src.readline()
+                kept_from = src.tell()
+                shutil.copyfileobj(src, dst)
+
+            for generation in range(_HISTORY_GENERATIONS - 1, 0, -1):
+                older = self.history_file.with_name(f"history.log.{generation}")
+                if older.exists():
+                    os.replace(
+                        older,
+                        self.history_file.with_name(f"history.log.{generation + 1}"),
+                    )
+            archived = self.history_file.with_name("history.log.1")
+            os.replace(self.history_file, archived)
+            os.replace(tmp_path, self.history_file)
+            # The kept tail now lives on in the new log only
+            os.truncate(archived, kept_from)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def flush(self) -> None:
+        """Write any pending collection and history changes to disk."""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+                atexit.unregister(self.flush)
+
+            if self._collections_dirty:
+                self._collections_dirty = False
+                try:
+                    self._write_collections_file(self._collections_data)
+                except Exception as e:
+                    logging.error(f"Error saving collections: {e}")
+
+            self.flush_history()
+
+    def _schedule_flush(self) -> None:
+        """Flush write_delay after the last write, waiting at most twice that."""
+        with self._flush_lock:
+            now = time.monotonic()
+            if self._flush_timer is None:
+                self._flush_deadline = now + 2 * self.write_delay
+                # Only held by atexit while writes are pending
+                atexit.register(self.flush)
+            else:
+                self._flush_timer.cancel()
+
+            delay = min(self.write_delay, max(0.0, self._flush_deadline - now))
+            self._flush_timer = threading.Timer(delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
 
     def load_history(self, limit: int = 50) -> List[HistoryEntry]:
         """Load request history."""
+        self.flush_history()
+
         try:
             entries = []
-            with open(self.history_file, "r") as f:
-                lines = f.readlines()
-
-                # Get the last 'limit' lines
-                for line in lines[-limit:]:
-                    if line.strip():
-                        data = json.loads(line.strip())
-                        # Parse datetime string back to datetime object
-                        if isinstance(data["timestamp"], str):
-                            data["timestamp"] = datetime.fromisoformat(
-                                data["timestamp"]
-                            )
-                        entries.append(HistoryEntry(**data))
+            for line in self._read_history_tail(limit):
+                try:
+                    data = json_loads(line)
+                except ValueError:
+                    # A write torn by a crash leaves a partial line; skip it
+                    logging.warning("Skipping corrupt history entry")
+                    continue
+                # The validator parses the ISO timestamp string itself
+                entries.append(HistoryEntry.model_validate(data))
 
             return entries
         except Exception as e:
             logging.error(f"Error loading history: {e}")
             return []
 
+    def _read_history_tail(self, limit: int) -> List[bytes]:
+        """Read the last 'limit' non-empty lines without loading the whole file."""
+        with open(self.history_file, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _MMAP_THRESHOLD:
+                lines = [line for line in f.read().split(b"\n") if line.strip()]
+                return lines[-limit:]
+
+            # Walk backwards through the mapped file, copying only needed lines
+            lines = []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = size
+                while end > 0 and (limit <= 0 or len(lines) < limit):
+                    start = mm.rfind(b"\n", 0, end) + 1
+                    line = mm[start:end]
+                    if line.strip():
+                        lines.append(line)
+                    end = start - 1
+
+            lines.reverse()
+            return lines
+
     def resolve_variables(self, text: str, environment: str = "default") -> str:
         """Resolve environment variables in text using {{VAR}} syntax."""
-        env = self.load_environment(environment)
-        if not env:
+        # Most header values and URLs have no placeholders; keep them out of
+        # the per-environment cache
+        if "{{" not in text:
             return text
 
-        resolved = text
-        for var_name, var_value in env.variables.items():
-            resolved = resolved.replace(f"{{{{{var_name}}}}}", var_value)
+        env = self._cached_environments().get(environment)
+        if not env or not env.variables:
+            return text
 
-        return resolved
+        cached = self._resolved_templates.get(environment)
+        if cached is None:
+            cached = (_variable_substituter(env.variables), OrderedDict())
+            self._resolved_templates[environment] = cached
+
+        # URLs and headers are resolved with the same templates on every send
+        resolved = cached[1]
+        result = resolved.get(text)
+        if result is not None:
+            resolved.move_to_end(text)
+            return result
+
+        result = cached[0](text)
+        resolved[text] = result
+        if len(resolved) > _RESOLVED_CACHE_SIZE:
+            resolved.popitem(last=False)
+        return result
@@ -0,0 +1,17 @@
+"""Tests for request body handling."""
+
+import math
+
+from apicrafter.body import BodyHandler, BodyType
+
+
+def test_cli_json_body_is_parsed_as_written():
+    """Test that CLI JSON bodies keep large integers and non-finite numbers."""
+    config = BodyHandler.parse_body_from_cli(
+        '{"id": 123456789012345678901234567890, "x": NaN, "y": Infinity}', None, None
+    )
+
+    assert config.body_type == BodyType.JSON
+    assert config.content["id"] == 123456789012345678901234567890
+    assert math.isnan(config.content["x"])
+    assert config.content["y"] == math.inf
@@ -0,0 +1,179 @@
+"""Tests for schema loader functionality."""
+
+import copy
+import json
+import pickle
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from apicrafter.schema_loader import SchemaEndpoint, SchemaLoader
+from apicrafter.storage import StorageManager
+
+
+@pytest.fixture
+def loader():
+    """Create a schema loader backed by temporary storage."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield SchemaLoader(StorageManager(Path(temp_dir)))
+
+
+@pytest.fixture
+def sample_schema():
+    """Create a small OpenAPI schema."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "User API", "version": "2.0.0"},
+        "paths": {
+            "/users": {
+                "get": {"summary": "List users"},
+                "post": {
+                    "summary": "Create user",
+                    "requestBody": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/User"}
+                            }
+                        }
+                    },
+                },
+            },
+            "/users/{id}": {
+                "get": {"summary": "Get user"},
+                "parameters": [{"name": "id", "in": "path"}],
+            },
+        },
+        "components": {
+            "schemas": {
+                "User": {
+                    "type": "object",
+                    "properties": {"username": {"type": "string"}},
+                    "required": ["username"],
+                }
+            }
+        },
+    }
+
+
+def test_parse_schema_defers_endpoint_parsing(loader, sample_schema):
+    """Test that endpoints are only parsed when looked up."""
+    api_schema = loader._parse_openapi_schema(sample_schema, "https://api.test")
+
+    assert api_schema.title == "User API"
+    assert api_schema._endpoint_cache == {}
+    assert loader.list_endpoints(api_schema) == [
+        ("GET", "/users"),
+        ("GET", "/users/{id}"),
+        ("POST", "/users"),
+    ]
+    assert loader.get_schema_summary(api_schema)["total_endpoints"] == 3
+
+    endpoint = loader.get_endpoint_schema(api_schema, "post", "/users")
+
+    assert endpoint is not None
+    assert endpoint.summary == "Create user"
+    assert endpoint.body_schema["required"] == ["username"]
+    assert loader.get_endpoint_schema(api_schema, "POST", "/users") is endpoint
+
+
+def test_get_endpoint_schema_matches_path_parameters(loader, sample_schema):
+    """Test endpoint lookup with path parameters."""
+    api_schema = loader._parse_openapi_schema(sample_schema, "https://api.test")
+
+    endpoint = loader.get_endpoint_schema(api_schema, "GET", "/users/42")
+
+    assert endpoint is not None
+    assert endpoint.path == "/users/{id}"
+    assert loader.get_endpoint_schema(api_schema, "DELETE", "/users/42") is None
+    assert loader.get_endpoint_schema(api_schema, "GET", "users/42/").path == (
+        "/users/{id}"
+    )
+    assert loader.get_endpoint_schema(api_schema, "GET", "/users/42/posts") is None
+
+
+def test_get_endpoints_parses_all(loader, sample_schema):
+    """Test materializing the full endpoint list."""
+    api_schema = loader._parse_openapi_schema(sample_schema, "https://api.test")
+
+    endpoints = loader.get_endpoints(api_schema)
+
+    assert len(endpoints) == 3
+    assert api_schema.endpoints is endpoints
+    assert {(e.method, e.path) for e in endpoints} == set(
+        loader.list_endpoints(api_schema)
+    )
+
+
+def test_endpoints_field_is_filled_on_access(loader, sample_schema):
+    """Test that reading schema.endpoints parses every operation."""
+    api_schema = loader._parse_openapi_schema(sample_schema, "https://api.test")
+
+    assert {(e.method, e.path) for e in api_schema.endpoints} == set(
+        loader.list_endpoints(api_schema)
+    )
+    assert loader.get_endpoints(api_schema) is api_schema.endpoints
+
+    dumped = loader._parse_openapi_schema(sample_schema, "").model_dump()
+    assert len(dumped["endpoints"]) == 3
+
+
+def test_parsed_schema_copies_pickles_and_compares(loader, sample_schema):
+    """Test that copies and comparisons include endpoints not yet parsed."""
+    api_schema = loader._parse_openapi_schema(sample_schema, "https://api.test")
+    other = loader._parse_openapi_schema(sample_schema, "https://api.test")
+    loader.get_endpoint_schema(other, "GET", "/users/42")
+
+    assert api_schema == other
+    assert len(copy.deepcopy(api_schema).endpoints) == 3
+
+    restored = pickle.loads(pickle.dumps(other))
+    assert restored == api_schema
+    assert loader.get_endpoint_schema(restored, "POST", "/users").summary == (
+        "Create user"
+    )
+
+
+def test_load_schema_from_file_reuses_unchanged_file(loader, sample_schema, tmp_path):
+    """Test that a schema file is only parsed again after it changes."""
+    schema_file = tmp_path / "openapi.json"
+    schema_file.write_text(json.dumps(sample_schema))
+
+    first = loader.load_schema_from_file(str(schema_file))
+
+    assert first is not None
+    assert loader.load_schema_from_file(str(schema_file)) is first
+
+    sample_schema["info"]["title"] = "Renamed API"
+    schema_file.write_text(json.dumps(sample_schema))
+    reloaded = loader.load_schema_from_file(str(schema_file))
+
+    assert reloaded is not first
+    assert reloaded.title == "Renamed API"
+
+
+def test_endpoint_required_names():
+    """Test the required header and body field shortcuts."""
+    endpoint = SchemaEndpoint(
+        method="POST",
+        path="/users",
+        headers={
+            "Authorization": {"type": "string", "required": True},
+            "X-Trace": {"type": "string"},
+            "Content-Type": {"type": "string", "required": True},
+        },
+        body_schema={"type": "object", "required": ["username", "email"]},
+    )
+
+    assert endpoint.required_headers == ("Authorization", "Content-Type")
+    assert endpoint.required_body_fields == ("username", "email")
+    assert SchemaEndpoint(method="GET", path="/").required_body_fields == ()
+
+
+def test_cached_schema_round_trip(loader, sample_schema):
+    """Test that a cached schema is read back and no temp files are left."""
+    loader._cache_schema("https://api.test", sample_schema)
+
+    assert loader._load_cached_schema("https://api.test") == sample_schema
+    assert loader._load_cached_schema("https://other.test") is None
+    assert [p.suffix for p in loader.cache_dir.iterdir()] == [".json"]
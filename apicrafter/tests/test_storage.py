@@ -1,11 +1,15 @@
 """Tests for storage functionality."""
 
+import gc
 import json
+import os
 import tempfile
+import weakref
 from datetime import datetime
 from pathlib import Path
 
 import pytest
+import yaml
 
 from apicrafter.storage import Environment, HistoryEntry, RequestData, StorageManager
 
@@ -111,6 +115,15 @@ def test_variable_resolution(temp_storage):
     assert resolved == expected
 
 
+def test_variable_resolution_leaves_unknown_names(temp_storage):
+    """Test that placeholders without a matching variable are kept."""
+    temp_storage.save_environment(Environment(name="test", variables={"ID": "7"}))
+
+    resolved = temp_storage.resolve_variables("{{{ID}}}/{{OTHER}}/{{ ID }}", "test")
+
+    assert resolved == "{7}/{{OTHER}}/{{ ID }}"
+
+
 def test_variable_resolution_missing_env(temp_storage):
     """Test variable resolution with missing environment."""
     text = "{{BASE_URL}}/users/{{USER_ID}}"
@@ -139,3 +152,408 @@ def test_collections_persistence(temp_storage):
     assert loaded_request is not None
     assert loaded_request.method == "GET"
     assert loaded_request.url == "https://api.example.com/test"
+
+
+def test_collections_cache_reused_until_file_changes(temp_storage):
+    """Test that parsed collections are cached and refreshed on external edits."""
+    request_data = RequestData(method="GET", url="https://api.example.com/a")
+    temp_storage.save_request("a", request_data, "cached")
+
+    first = temp_storage._cached_collections()
+    assert temp_storage._cached_collections() is first
+
+    # Simulate another process writing the file
+    other = StorageManager(temp_storage.config_dir)
+    other.save_request(
+        "b", RequestData(method="GET", url="https://api.example.com/b"), "cached"
+    )
+    os.utime(temp_storage.collections_file, ns=(0, 1))
+
+    reloaded = temp_storage._cached_collections()
+    assert reloaded is not first
+    assert set(reloaded["cached"].requests) == {"a", "b"}
+
+
+def test_loaded_collections_can_be_modified(temp_storage):
+    """Test that changing loaded collections leaves the storage untouched."""
+    temp_storage.save_request(
+        "a", RequestData(method="GET", url="https://api.example.com/a")
+    )
+    version = temp_storage.collections_version
+
+    collections = temp_storage.load_collections()
+    collections["default"].requests.pop("a")
+    collections.pop("default")
+
+    assert temp_storage.load_request("a") is not None
+    assert set(temp_storage.load_collections()["default"].requests) == {"a"}
+    assert temp_storage.collections_version == version
+
+
+def test_loaded_environments_can_be_modified(temp_storage):
+    """Test that changing loaded environments leaves the storage untouched."""
+    temp_storage.save_environment(
+        Environment(name="dev", variables={"HOST": "dev.example.com"})
+    )
+
+    environments = temp_storage.load_environments()
+    environments["dev"].variables["HOST"] = "changed.example.com"
+    environments.pop("dev")
+    temp_storage.load_environment("dev").variables.clear()
+
+    assert temp_storage.load_environment("dev").variables == {"HOST": "dev.example.com"}
+    assert temp_storage.resolve_variables("{{HOST}}", "dev") == "dev.example.com"
+
+
+def test_history_entries_are_written_immediately(temp_storage):
+    """Test that without a write delay each history entry reaches the file."""
+    for i in range(5):
+        temp_storage.add_to_history(
+            HistoryEntry(
+                timestamp=datetime.now(),
+                method="GET",
+                url=f"https://api.example.com/items/{i}",
+                status_code=200,
+            )
+        )
+
+        assert len(temp_storage.history_file.read_bytes().splitlines()) == i + 1
+
+    history = temp_storage.load_history(10)
+
+    assert [entry.url for entry in history] == [
+        f"https://api.example.com/items/{i}" for i in range(5)
+    ]
+
+
+def test_load_history_reads_tail_only(temp_storage, monkeypatch):
+    """Test that large history files are scanned backwards from the end."""
+    monkeypatch.setattr("apicrafter.storage._MMAP_THRESHOLD", 64)
+
+    for i in range(30):
+        temp_storage.add_to_history(
+            HistoryEntry(
+                timestamp=datetime.now(),
+                method="GET",
+                url=f"https://api.example.com/items/{i}",
+            )
+        )
+
+    history = temp_storage.load_history(12)
+
+    assert [entry.url for entry in history] == [
+        f"https://api.example.com/items/{i}" for i in range(18, 30)
+    ]
+    assert len(temp_storage.load_history(100)) == 30
+
+
+def test_history_rotation_keeps_recent_entries(temp_storage, monkeypatch):
+    """Test that an oversized history log is rotated and keeps its tail."""
+    monkeypatch.setattr("apicrafter.storage._HISTORY_MAX_BYTES", 1000)
+    monkeypatch.setattr("apicrafter.storage._HISTORY_KEEP_BYTES", 500)
+
+    for i in range(40):
+        temp_storage.add_to_history(
+            HistoryEntry(
+                timestamp=datetime.now(),
+                method="GET",
+                url=f"https://api.example.com/items/{i}",
+            )
+        )
+        temp_storage.flush_history()
+
+    config_dir = temp_storage.config_dir
+    assert temp_storage.history_file.stat().st_size <= 1000
+    assert (config_dir / "history.log.1").exists()
+    assert (config_dir / "history.log.3").exists()
+    assert not (config_dir / "history.log.4").exists()
+
+    history = temp_storage.load_history(3)
+    assert [entry.url for entry in history] == [
+        f"https://api.example.com/items/{i}" for i in range(37, 40)
+    ]
+
+    # Each entry is kept in exactly one generation, oldest first
+    ids = [
+        int(json.loads(line)["url"].rsplit("/", 1)[1])
+        for name in ("history.log.3", "history.log.2", "history.log.1", "history.log")
+        for line in (config_dir / name).read_bytes().splitlines()
+    ]
+    assert ids == list(range(ids[0], 40))
+
+
+def test_load_history_skips_torn_entry(temp_storage):
+    """Test that a partially written history line does not hide other entries."""
+    temp_storage.add_to_history(
+        HistoryEntry(timestamp=datetime.now(), method="GET", url="https://a.test")
+    )
+    with open(temp_storage.history_file, "ab") as f:
+        f.write(b'{"timestamp": "2024-01-01T00:00:00", "meth')
+
+    history = temp_storage.load_history(10)
+
+    assert [entry.url for entry in history] == ["https://a.test"]
+
+
+def test_variable_resolution_after_environment_update(temp_storage):
+    """Test that resolution reflects variables added to a saved environment."""
+    temp_storage.save_environment(
+        Environment(name="test", variables={"BASE_URL": "https://a.example.com"})
+    )
+    text = "{{BASE_URL}}/users/{{USER_ID}}"
+    assert temp_storage.resolve_variables(text, "test") == (
+        "https://a.example.com/users/{{USER_ID}}"
+    )
+
+    env = temp_storage.load_environment("test")
+    env.variables["USER_ID"] = "42"
+    temp_storage.save_environment(env)
+
+    assert temp_storage.resolve_variables(text, "test") == (
+        "https://a.example.com/users/42"
+    )
+
+
+def test_variable_resolution_after_environments_file_edit(temp_storage):
+    """Test that resolution picks up environments edited in the file."""
+    temp_storage.save_environment(
+        Environment(name="test", variables={"HOST": "a.example.com"})
+    )
+    assert temp_storage.resolve_variables("{{HOST}}", "test") == "a.example.com"
+
+    variables = {"HOST": "b.example.com"}
+    data = {"environments": {"test": {"name": "test", "variables": variables}}}
+    temp_storage.environments_file.write_text(json.dumps(data))
+    mtime = temp_storage.environments_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(temp_storage.environments_file, ns=(mtime, mtime))
+
+    assert temp_storage.resolve_variables("{{HOST}}", "test") == "b.example.com"
+
+
+def test_invalid_storage_files_are_rejected(temp_storage):
+    """Test that hand-edited files with invalid values are not loaded."""
+    environments = {"environments": {"dev": {"name": "dev", "variables": {"A": 1}}}}
+    temp_storage.environments_file.write_text(json.dumps(environments))
+    collections = {
+        "collections": {
+            "default": {"name": "default", "requests": {"a": {"url": "/a"}}}
+        }
+    }
+    temp_storage.collections_file.write_text(json.dumps(collections))
+
+    assert temp_storage.load_environments() == {}
+    assert temp_storage.resolve_variables("{{A}}", "dev") == "{{A}}"
+    assert temp_storage.load_collections() == {}
+
+
+def test_legacy_yaml_files_are_migrated():
+    """Test that YAML storage files from older versions are carried over."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir)
+        (config_dir / "collections.yaml").write_text(
+            "collections:\n"
+            "  legacy:\n"
+            "    name: legacy\n"
+            "    requests:\n"
+            "      ping:\n"
+            "        method: GET\n"
+            "        url: https://api.example.com/ping\n"
+        )
+        (config_dir / "envs.yaml").write_text(
+            "environments:\n"
+            "  prod:\n"
+            "    name: prod\n"
+            "    variables:\n"
+            "      BASE_URL: https://api.example.com\n"
+        )
+
+        storage = StorageManager(config_dir)
+
+        assert storage.collections_file.name == "collections.json"
+        assert json.loads(storage.collections_file.read_text())["collections"]
+        request = storage.load_request("ping", "legacy")
+        assert request is not None
+        assert request.url == "https://api.example.com/ping"
+        assert storage.load_environment("prod").variables == {
+            "BASE_URL": "https://api.example.com"
+        }
+
+
+def test_save_request_updates_file_incrementally(temp_storage):
+    """Test that saving one request keeps the others intact on disk."""
+    for name in ("one", "two"):
+        temp_storage.save_request(
+            name,
+            RequestData(method="GET", url=f"https://api.example.com/{name}"),
+            "incremental",
+        )
+    temp_storage.save_request(
+        "one", RequestData(method="DELETE", url="https://api.example.com/one")
+    )
+
+    data = json.loads(temp_storage.collections_file.read_text())
+
+    assert set(data["collections"]) == {"incremental", "default"}
+    assert data["collections"]["incremental"]["requests"]["two"]["method"] == "GET"
+    assert data["collections"]["default"]["requests"]["one"]["method"] == "DELETE"
+    assert list(temp_storage.config_dir.glob("*.tmp")) == []
+
+
+def test_save_collections_reuses_request_dumps(temp_storage, monkeypatch):
+    """Test that a full collections save only serializes changed requests."""
+    temp_storage.save_request(
+        "one", RequestData(method="GET", url="https://api.example.com/one")
+    )
+    collections = temp_storage.load_collections()
+    collections["default"].requests["two"] = RequestData(
+        method="POST", url="https://api.example.com/two"
+    )
+
+    dumped = []
+    original_dump = RequestData.model_dump
+
+    def counting_dump(self, *args, **kwargs):
+        dumped.append(self.url)
+        return original_dump(self, *args, **kwargs)
+
+    monkeypatch.setattr(RequestData, "model_dump", counting_dump)
+    temp_storage._save_collections(collections)
+
+    data = json.loads(temp_storage.collections_file.read_text())
+
+    assert dumped == ["https://api.example.com/two"]
+    assert set(data["collections"]["default"]["requests"]) == {"one", "two"}
+
+
+def test_large_integers_round_trip(temp_storage, monkeypatch):
+    """Test that integers beyond 64 bits are saved and loaded exactly."""
+    big = 2**70
+    temp_storage.save_request(
+        "big",
+        RequestData(
+            method="POST", url="https://api.example.com", json_data={"id": big}
+        ),
+    )
+
+    # A fresh manager re-reads the file, memory-mapped if large enough
+    monkeypatch.setattr("apicrafter.storage._MMAP_THRESHOLD", 1)
+    loaded = StorageManager(temp_storage.config_dir).load_request("big")
+
+    assert loaded.json_data == {"id": big}
+    assert json.loads(temp_storage.collections_file.read_text())["collections"][
+        "default"
+    ]["requests"]["big"]["json_data"] == {"id": big}
+
+
+def test_edited_requests_are_saved_with_current_values(temp_storage):
+    """Test that requests changed in place are not saved from stale dumps."""
+    temp_storage.save_request(
+        "one", RequestData(method="GET", url="https://api.example.com/one")
+    )
+    request = StorageManager(temp_storage.config_dir).load_request("one")
+
+    request.url = "https://api.example.com/copy"
+    temp_storage.save_request("copy", request)
+    request.headers["X-Edited"] = "1"
+    temp_storage._save_collections(temp_storage.load_collections())
+
+    saved = json.loads(temp_storage.collections_file.read_text())
+    requests = saved["collections"]["default"]["requests"]
+    assert requests["one"]["url"] == "https://api.example.com/one"
+    assert requests["copy"]["url"] == "https://api.example.com/copy"
+    assert requests["copy"]["headers"] == {"X-Edited": "1"}
+
+
+def test_collections_version_changes_on_save(temp_storage):
+    """Test that collection changes bump the collections version."""
+    temp_storage.load_collections()
+    version = temp_storage.collections_version
+
+    temp_storage.load_collections()
+    assert temp_storage.collections_version == version
+
+    temp_storage.save_request(
+        "one", RequestData(method="GET", url="https://api.example.com/one")
+    )
+    assert temp_storage.collections_version > version
+
+
+def test_failed_environment_write_keeps_previous_file(temp_storage, monkeypatch):
+    """Test that an interrupted save leaves the old file and no temp files."""
+    temp_storage.save_environment(Environment(name="dev", variables={"A": "1"}))
+    before = temp_storage.environments_file.read_bytes()
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("apicrafter.storage.os.fsync", failing_fsync)
+    with pytest.raises(OSError):
+        temp_storage.save_environment(Environment(name="prod", variables={}))
+
+    assert temp_storage.environments_file.read_bytes() == before
+    assert list(temp_storage.config_dir.glob("*.tmp")) == []
+
+
+def test_delayed_writes_are_coalesced_until_flush():
+    """Test that a storage manager with write_delay defers disk writes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = StorageManager(Path(temp_dir), write_delay=60)
+        for name in ("one", "two", "three"):
+            storage.save_request(
+                name, RequestData(method="GET", url=f"https://api.example.com/{name}")
+            )
+        storage.add_to_history(
+            HistoryEntry(timestamp=datetime.now(), method="GET", url="https://a.b")
+        )
+
+        # Pending changes are visible in-process but not yet on disk
+        assert set(storage.load_collections()["default"].requests) == {
+            "one",
+            "two",
+            "three",
+        }
+        assert StorageManager(Path(temp_dir)).load_collections() == {}
+        assert storage.history_file.read_bytes() == b""
+
+        storage.flush()
+
+        reloaded = StorageManager(Path(temp_dir))
+        assert set(reloaded.load_collections()["default"].requests) == {
+            "one",
+            "two",
+            "three",
+        }
+        assert len(reloaded.load_history()) == 1
+
+
+def test_storage_managers_are_not_kept_alive_for_exit():
+    """Test that only managers with pending writes are held until exit."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        ref = weakref.ref(StorageManager(Path(temp_dir)))
+        gc.collect()
+        assert ref() is None
+
+        delayed = StorageManager(Path(temp_dir), write_delay=60)
+        delayed.save_request("one", RequestData(method="GET", url="https://a.b"))
+        timer = delayed._flush_timer
+        delayed.flush()
+        timer.join()
+
+        ref = weakref.ref(delayed)
+        del delayed, timer
+        gc.collect()
+        assert ref() is None
+
+
+def test_failed_migration_keeps_legacy_file():
+    """Test that a YAML file that cannot be migrated is left in place."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir)
+        legacy_file = config_dir / "collections.yaml"
+        legacy_file.write_text("collections: [\n")
+
+        with pytest.raises(yaml.YAMLError):
+            StorageManager(config_dir)
+
+        assert legacy_file.read_text() == "collections: [\n"
+        assert not (config_dir / "collections.json").exists()
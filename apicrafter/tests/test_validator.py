@@ -0,0 +1,343 @@
+"""Tests for request validation."""
+
+import pickle
+
+import pytest
+
+from apicrafter.schema_loader import SchemaEndpoint
+from apicrafter.validator import RequestValidator, ValidationResult
+
+
+@pytest.fixture
+def validator():
+    """Create a request validator."""
+    return RequestValidator()
+
+
+@pytest.fixture
+def endpoint():
+    """Create an endpoint exercising headers, query parameters and body."""
+    return SchemaEndpoint(
+        method="POST",
+        path="/users/{id}",
+        headers={
+            "Authorization": {"type": "string", "required": True},
+            "Content-Type": {"type": "string", "enum": ["application/json"]},
+        },
+        query_params={
+            "limit": {"type": "integer", "minimum": 1, "maximum": 100},
+            "token": {"type": "string", "required": True},
+        },
+        body_schema={
+            "type": "object",
+            "properties": {
+                "username": {"type": "string", "minLength": 3, "maxLength": 8},
+                "email": {"type": "string", "pattern": r"^[^@]+@[^@]+\.[^@]+$"},
+                "age": {"type": "integer", "minimum": 0},
+                "tags": {
+                    "type": "array",
+                    "maxItems": 2,
+                    "items": {"type": "string"},
+                },
+                "address": {
+                    "type": "object",
+                    "properties": {"city": {"type": "string"}},
+                    "required": ["city"],
+                    "additionalProperties": False,
+                },
+            },
+            "required": ["username"],
+        },
+    )
+
+
+def _generic_result(validator, endpoint, headers, query_params, body):
+    """Validate with the uncompiled per-section methods."""
+    result = ValidationResult()
+    validator.validate_headers(endpoint.headers, headers, result)
+    validator.validate_query_params(endpoint.query_params, query_params, result)
+    validator.validate_body(endpoint.body_schema, body, result)
+    return result
+
+
+def _errors(result):
+    return sorted((e.field, e.message, repr(e.value)) for e in result.errors)
+
+
+@pytest.mark.parametrize(
+    "headers,query_params,body",
+    [
+        (
+            {"authorization": "Bearer x", "Content-Type": "application/json"},
+            {"limit": 10, "token": "t"},
+            {"username": "johndoe", "email": "john@example.com"},
+        ),
+        (
+            {"Content-Type": "text/plain", "X-Extra": "1"},
+            {"limit": 0, "page": 2},
+            {
+                "username": "jo",
+                "email": "nope",
+                "age": "old",
+                "tags": ["a", 1, "c"],
+                "address": {"zip": "123"},
+            },
+        ),
+        ({}, {}, '{"username": 5}'),
+        ({}, {}, "not json"),
+        ({}, {}, ["not", "an", "object"]),
+    ],
+)
+def test_compiled_validator_matches_generic_methods(
+    validator, endpoint, headers, query_params, body
+):
+    """Test that the compiled validator reports the same problems."""
+    compiled = validator.validate_request(
+        endpoint, headers=headers, query_params=query_params, body=body
+    )
+    generic = _generic_result(validator, endpoint, headers, query_params, body)
+
+    assert _errors(compiled) == _errors(generic)
+    assert sorted(compiled.warnings) == sorted(generic.warnings)
+    assert compiled.is_valid == (not generic.errors)
+
+
+def test_compiled_validator_is_cached_on_endpoint(validator, endpoint):
+    """Test that an endpoint is only compiled once."""
+    validator.validate_request(endpoint, body={"username": "johndoe"})
+    compiled = endpoint._compiled_validator
+
+    validator.validate_request(endpoint, body={"username": "janedoe"})
+
+    assert compiled is not None
+    assert endpoint._compiled_validator is compiled
+
+
+def test_validated_endpoint_can_be_pickled(validator, endpoint):
+    """Test that a compiled validator does not stop an endpoint pickling."""
+    validator.validate_request(endpoint, body={"username": "johndoe"})
+
+    restored = pickle.loads(pickle.dumps(endpoint))
+
+    assert restored._compiled_validator is None
+    assert endpoint._compiled_validator is not None
+    assert not validator.validate_request(restored, body={"username": 1}).is_valid
+
+
+def test_validate_request_checks_method_and_path(validator, endpoint):
+    """Test method and path validation around the compiled checks."""
+    result = validator.validate_request(
+        endpoint,
+        headers={"Authorization": "Bearer x"},
+        query_params={"token": "t"},
+        body={"username": "johndoe"},
+        method="get",
+        path="/accounts/42",
+    )
+
+    assert not result.is_valid
+    assert [e.field for e in result.errors] == ["method", "path"]
+
+
+def test_booleans_are_not_integers(validator):
+    """Test that True is rejected where an integer or number is expected."""
+    for field_type in ("integer", "number"):
+        result = validator.validate_field_value("flag", True, {"type": field_type})
+        assert [e.message for e in result.errors] == [
+            f"Expected {field_type}, got bool"
+        ]
+
+    assert validator.validate_field_value("count", 3, {"type": "integer"}).is_valid
+    assert validator.validate_field_value("flag", True, {"type": "boolean"}).is_valid
+
+
+def test_validators_accumulate_into_given_result(validator):
+    """Test that sub-validators add to a passed result instead of a new one."""
+    result = ValidationResult()
+
+    returned = validator.validate_field_value("a", 1, {"type": "string"}, result)
+    validator.validate_array(["x", 2], {"items": {"type": "string"}}, "b", result)
+
+    assert returned is result
+    assert not result.is_valid
+    assert [e.field for e in result.errors] == ["a", "b[1]"]
+
+
+@pytest.mark.parametrize(
+    "actual_path,fields",
+    [
+        ("/users/42", []),
+        ("users/42/", []),
+        ("/users/42/posts", ["path"]),
+        ("/accounts/42", ["path"]),
+        ("/users//", ["path"]),
+        ("/users/%7Bid%7D", []),
+    ],
+)
+def test_validate_path_parameters(validator, actual_path, fields):
+    """Test path matching against a templated schema path."""
+    result = validator.validate_path_parameters("/users/{id}", actual_path)
+
+    assert [e.field for e in result.errors] == fields
+
+
+def test_generic_validation_handles_deep_nesting(validator):
+    """Test that deeply nested values are validated without recursion."""
+    depth = 5000
+    schema = value = None
+    for _ in range(depth):
+        schema = {"type": "array", "items": schema or {"type": "integer"}}
+        value = [value if value is not None else "x"]
+
+    result = validator.validate_field_value("body", value, schema)
+
+    assert len(result.errors) == 1
+    assert result.errors[0].field == "body" + "[0]" * depth
+
+
+@pytest.mark.parametrize("use_msgspec", [False, True])
+def test_compiled_validation_handles_deep_nesting(use_msgspec):
+    """Test that validate_request checks deeply nested bodies without recursion."""
+    depth = 5000
+    schema = value = None
+    for _ in range(depth):
+        schema = {"type": "array", "items": schema or {"type": "integer"}}
+        value = [value if value is not None else "x"]
+    endpoint = SchemaEndpoint(method="POST", path="/items", body_schema=schema)
+
+    validator = RequestValidator(use_msgspec=use_msgspec)
+    result = validator.validate_request(endpoint, body=value)
+
+    assert len(result.errors) == 1
+    assert result.errors[0].field == "body" + "[0]" * depth
+
+
+def test_generic_validation_reports_errors_in_document_order(validator):
+    """Test that errors follow the order of the validated document."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "a": {"type": "object", "properties": {"b": {"type": "integer"}}},
+            "c": {"type": "string"},
+        },
+        "required": ["z"],
+        "additionalProperties": False,
+    }
+    value = {"a": {"b": "1"}, "extra": 1, "c": 2}
+
+    result = validator.validate_field_value("body", value, schema)
+
+    assert [e.field for e in result.errors] == [
+        "body.z",
+        "body.a.b",
+        "body.extra",
+        "body.c",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("body", "properties"),
+    [
+        ('{"username": "johndoe", "email": "john@example.com", "tags": ["a"]}', {}),
+        ('{"username": "johndoe", "address": {"city": "Paris"}, "extra": null}', {}),
+        ('{"email": "x@y.z"}', {}),
+        ('{"username": "johndoe", "email": "nope@", "age": 1.5}', {}),
+        ('{"username": "johndoe", "age": true, "tags": ["a", "b", "c"]}', {}),
+        ('{"username": "johndoe", "address": {"city": "Paris", "zip": "1"}}', {}),
+        ('{"username": null}', {}),
+        ("[1, 2]", {}),
+        ("not json", {}),
+        (
+            '{"username": "johndoe", "meta": {"a": 1}}',
+            {
+                "meta": {
+                    "type": "object",
+                    "required": ["a"],
+                    "additionalProperties": False,
+                    "properties": {},
+                }
+            },
+        ),
+    ],
+)
+def test_msgspec_validation_matches_python_checks(endpoint, body, properties):
+    """Test that the msgspec fast path accepts and reports the same bodies."""
+    pytest.importorskip("msgspec")
+    endpoint.body_schema["properties"].update(properties)
+    fast = RequestValidator(use_msgspec=True).validate_request(endpoint, body=body)
+    plain = RequestValidator().validate_request(endpoint, body=body)
+
+    assert _errors(fast) == _errors(plain)
+    assert fast.is_valid == plain.is_valid
+
+
+def test_msgspec_setting_recompiles_cached_validator(endpoint):
+    """Test that a cached validator is not reused across msgspec settings."""
+    pytest.importorskip("msgspec")
+    RequestValidator().validate_request(endpoint, body='{"username": "johndoe"}')
+    plain = endpoint._compiled_validator
+
+    RequestValidator(use_msgspec=True).validate_request(
+        endpoint, body='{"username": "johndoe"}'
+    )
+
+    assert endpoint._compiled_validator is not plain
+    assert endpoint._compiled_validator.uses_msgspec
+
+
+def test_validate_many_matches_validate_request(validator, endpoint):
+    """Test that batch validation gives the same results as one at a time."""
+    cases = [
+        {
+            "headers": {"Authorization": "Bearer x"},
+            "query_params": {"token": "t"},
+            "body": {"username": "johndoe"},
+        },
+        {"body": {"username": "jo"}, "path": "/accounts/1"},
+        {},
+    ]
+
+    results = validator.validate_many(endpoint, cases, method="put")
+
+    assert len(results) == len(cases)
+    for case, result in zip(cases, results):
+        single = validator.validate_request(endpoint, method="put", **case)
+        assert _errors(result) == _errors(single)
+        assert result.warnings == single.warnings
+        assert result.suggestions == single.suggestions
+
+
+@pytest.mark.parametrize("use_msgspec", [False, True])
+def test_large_integer_string_body_stays_integer(use_msgspec):
+    """Test that integers beyond 64 bits in a raw body are not read as floats."""
+    if use_msgspec:
+        pytest.importorskip("msgspec")
+    endpoint = SchemaEndpoint(
+        method="POST",
+        path="/",
+        body_schema={"type": "object", "properties": {"n": {"type": "integer"}}},
+    )
+    body = '{"n": 123456789012345678901234567890}'
+
+    validator = RequestValidator(use_msgspec=use_msgspec)
+    result = validator.validate_request(endpoint, body=body)
+
+    assert result.is_valid
+    assert validator.validate_body(endpoint.body_schema, body).is_valid
+
+
+def test_msgspec_falls_back_for_unsupported_pattern():
+    """Test that a pattern msgspec cannot compile is checked in Python."""
+    pytest.importorskip("msgspec")
+    endpoint = SchemaEndpoint(
+        method="POST",
+        path="/",
+        body_schema={
+            "type": "object",
+            "properties": {"code": {"type": "string", "pattern": "(?i)abc"}},
+        },
+    )
+    validator = RequestValidator(use_msgspec=True)
+
+    assert validator.validate_request(endpoint, body='{"code": "ABC"}').is_valid
+    assert not validator.validate_request(endpoint, body='{"code": "xyz"}').is_valid
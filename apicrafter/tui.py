@@ -12,13 +12,13 @@ from textual.widgets import (
     TabPane,
     LoadingIndicator,
 )
-import json
 import httpx
 
 from textual import work, events
 from textual.reactive import reactive
 from textual.message import Message
 
+from ._json import json_loads
 from .storage import StorageManager, RequestData
 from .http_client import APIClient, ResponseData
 
@@ -91,11 +91,60 @@ class ApiCrafterTUI(App):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.storage = StorageManager()
-        self.collections = self.storage.load_collections()
+        # Coalesce storage writes so bursts of saves don't block the UI
+        self.storage = StorageManager(write_delay=0.05)
+        # One client for the whole session so connections are reused
+        self._api_client = APIClient(self.storage)
+        # Loaded on first access so the UI can render before the file is parsed
+        self._collections = None
+        # Caches derived from storage, dropped when its collections_version moves:
+        # collection name -> request names, (collection, request) -> RequestData
+        self._request_names = {}
+        self._request_cache = {}
+        self._cache_version = None
         self.current_collection = None
         self.current_request = None
 
+    @property
+    def collections(self):
+        """Saved collections, reloaded whenever storage reports a change."""
+        self._check_cache_version()
+        if self._collections is None:
+            self._collections = self.storage.load_collections()
+            # Loading may itself pick up a changed file and move the version
+            self._request_names.clear()
+            self._request_cache.clear()
+            self._cache_version = self.storage.collections_version
+        return self._collections
+
+    def request_names(self, collection_name):
+        """Request names of a collection, cached until storage changes."""
+        self._check_cache_version()
+        names = self._request_names.get(collection_name)
+        if names is None:
+            collection = self.collections.get(collection_name)
+            names = tuple(collection.requests) if collection else ()
+            self._request_names[collection_name] = names
+        return names
+
+    def load_request(self, collection_name, request_name):
+        """Load a saved request, cached until storage changes."""
+        self._check_cache_version()
+        key = (collection_name, request_name)
+        if key not in self._request_cache:
+            self._request_cache[key] = self.storage.load_request(
+                request_name, collection_name
+            )
+        return self._request_cache[key]
+
+    def _check_cache_version(self) -> None:
+        """Drop the collections and derived caches if storage has changed."""
+        if self._cache_version != self.storage.collections_version:
+            self._collections = None
+            self._request_names.clear()
+            self._request_cache.clear()
+            self._cache_version = self.storage.collections_version
+
     def action_send_request(self) -> None:
         """Sends the selected API request."""
         if self.current_request:
@@ -106,9 +155,8 @@ class ApiCrafterTUI(App):
     def send_request_worker(self, request_to_send: RequestData) -> None:
         """Worker to send the request and update the UI."""
         try:
-            with APIClient() as client:
-                response = client.send_from_request_data(request_to_send)
-                self.post_message(ResponseView.RequestFinished(response))
+            response = self._api_client.send_from_request_data(request_to_send)
+            self.post_message(ResponseView.RequestFinished(response))
         except httpx.HTTPStatusError as e:
             error_response = ResponseData(
                 status_code=e.response.status_code,
@@ -140,9 +188,10 @@ class ApiCrafterTUI(App):
         self.query_one(ResponseView).response_data = message.response
         response_body = self.query_one("#response-body")
         try:
-            data = json.loads(message.response.text)
+            # Parses the bytes directly and keeps integers beyond 64 bits
+            data = json_loads(message.response.content)
             response_body.update(data)
-        except json.JSONDecodeError:
+        except ValueError:
             response_body.update(message.response.text)
         self.query_one(LoadingIndicator).display = False
 
@@ -165,11 +214,22 @@ class ApiCrafterTUI(App):
 
     def on_mount(self) -> None:
         """Called when the app is mounted."""
-        collection_list = self.query_one(CollectionList)
-        for collection_name in self.collections.keys():
-            collection_list.append(ListItem(Label(collection_name)))
         self.query_one(CollectionList).focus()
         self.query_one(LoadingIndicator).display = False
+        # Parse collections after the first frame has been drawn
+        self.call_after_refresh(self.populate_collections)
+
+    def populate_collections(self) -> None:
+        """Fill the collection list from storage."""
+        # Mount all items in one batch rather than one append per item
+        self.query_one(CollectionList).extend(
+            [ListItem(Label(name), name=name) for name in self.collections.keys()]
+        )
+
+    def on_unmount(self) -> None:
+        """Called when the app is unmounted."""
+        self._api_client.close()
+        self.storage.flush()
 
     def on_focus(self, event: events.Focus) -> None:
         """Called when a widget is focused."""
@@ -181,16 +241,19 @@ class ApiCrafterTUI(App):
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Called when a list item is selected."""
         if isinstance(event.list_view, CollectionList):
-            self.current_collection = event.item.children[0].renderable
-            requests = self.collections.get(self.current_collection, {})
+            self.current_collection = event.item.name
             request_list = self.query_one(RequestList)
             request_list.clear()
-            for request_name in requests.keys():
-                request_list.append(ListItem(Label(request_name)))
+            request_list.extend(
+                [
+                    ListItem(Label(name), name=name)
+                    for name in self.request_names(self.current_collection)
+                ]
+            )
         elif isinstance(event.list_view, RequestList):
-            request_name = event.item.children[0].renderable
-            self.current_request = self.storage.load_request(
-                request_name, self.current_collection
+            request_name = event.item.name
+            self.current_request = self.load_request(
+                self.current_collection, request_name
             )
             if self.current_request:
                 self.query_one(RequestDetail).request_data = self.current_request
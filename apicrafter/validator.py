@@ -1,25 +1,67 @@
 """Request validation engine for schema compliance."""
 
+import functools
+import io
 import json
 import re
-from typing import Any, Dict, List, Optional, Tuple, Union
-
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+from ._json import json_loads
 from .schema_loader import APISchema, SchemaEndpoint
 
+try:
+    import msgspec
+except ImportError:  # msgspec is an optional speedup
+    msgspec = None
+
+# JSON Schema type -> (accepted Python types, whether bool must be rejected).
+# bool subclasses int, so True would otherwise pass as an integer or number.
+_JSON_TYPES: Dict[str, Tuple[Union[type, Tuple[type, ...]], bool]] = {
+    "string": (str, False),
+    "integer": (int, True),
+    "number": ((int, float), True),
+    "boolean": (bool, False),
+    "array": (list, False),
+    "object": (dict, False),
+}
+
 
-class ValidationError(Exception):
-    """Custom exception for validation errors."""
+class ValidationError:
+    """A single validation problem reported in a ValidationResult."""
+
+    __slots__ = ("field", "message", "value")
 
     def __init__(self, field: str, message: str, value: Any = None):
         self.field = field
         self.message = message
         self.value = value
-        super().__init__(f"{field}: {message}")
+
+    def __str__(self) -> str:
+        return f"{self.field}: {self.message}"
+
+    def __repr__(self) -> str:
+        return (
+            f"ValidationError(field={self.field!r}, message={self.message!r}, "
+            f"value={self.value!r})"
+        )
 
 
 class ValidationResult:
     """Result of request validation."""
 
+    __slots__ = ("is_valid", "errors", "warnings", "suggestions")
+
     def __init__(self):
         self.is_valid = True
         self.errors: List[ValidationError] = []
@@ -51,12 +93,545 @@ class ValidationResult:
         return summary
 
 
+@functools.lru_cache(maxsize=512)
+def _compiled_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a schema pattern once and reuse it across fields and endpoints."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def _path_pattern(schema_path: str) -> "re.Pattern[str]":
+    """Compile a schema path like /users/{id} into a regex for whole paths."""
+    segments = [
+        "[^/]+" if part.startswith("{") and part.endswith("}") else re.escape(part)
+        for part in schema_path.strip("/").split("/")
+    ]
+    # Leading and trailing slashes are ignored, as in validate_path_parameters
+    return re.compile("/*" + "/".join(segments) + "/*")
+
+
+# Pending (check, value, field_path) items of a compiled validation
+CheckStack = List[Tuple[Callable[..., None], Any, str]]
+
+# A compiled check: (value, field_path, result, stack) -> None. Nested values
+# are pushed onto the stack rather than checked recursively.
+FieldCheck = Callable[[Any, str, ValidationResult, CheckStack], None]
+
+# A compiled endpoint validator: (headers, query_params, body, result) -> None
+RequestCheck = Callable[[Dict[str, str], Dict[str, str], Any, ValidationResult], None]
+
+
+def _run_all(checks: List[FieldCheck]) -> FieldCheck:
+    """Combine checks into one, avoiding the loop when there is only one."""
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(
+        value: Any, field_path: str, result: ValidationResult, stack: CheckStack
+    ) -> None:
+        for field_check in checks:
+            field_check(value, field_path, result, stack)
+
+    return check
+
+
+def _run_check(
+    check: FieldCheck, value: Any, field_path: str, result: ValidationResult
+) -> None:
+    """Run a compiled check, then the checks it queued for nested values."""
+    stack: CheckStack = []
+    check(value, field_path, result, stack)
+    while stack:
+        item_check, item, item_path = stack.pop()
+        item_check(item, item_path, result, stack)
+
+
+def _reject_additional(
+    value: Any, field_path: str, result: ValidationResult, stack: CheckStack
+) -> None:
+    """Report a property rejected by additionalProperties: false."""
+    result.add_error(field_path, "Additional property not allowed")
+
+
+def _compile_field(schema: Dict[str, Any]) -> FieldCheck:
+    """Compile a field schema into a check equivalent to validate_field_value."""
+    checks: List[FieldCheck] = []
+
+    field_type = schema.get("type", "string")
+    expected, rejects_bool = _JSON_TYPES.get(field_type, (None, False))
+    if expected is not None:
+
+        def check_type(
+            value: Any, field_path: str, result: ValidationResult, stack: CheckStack
+        ) -> None:
+            if not isinstance(value, expected) or (
+                rejects_bool and value.__class__ is bool
+            ):
+                result.add_error(
+                    field_path,
+                    f"Expected {field_type}, got {type(value).__name__}",
+                    value,
+                )
+
+        checks.append(check_type)
+
+    enum_values = schema.get("enum")
+    if enum_values:
+        try:
+            enum_set = frozenset(enum_values)
+        except TypeError:  # unhashable members such as objects
+            enum_set = None
+
+        def check_enum(
+            value: Any, field_path: str, result: ValidationResult, stack: CheckStack
+        ) -> None:
+            try:
+                allowed = value in (enum_set if enum_set is not None else enum_values)
+            except TypeError:  # unhashable value; fall back to comparing each
+                allowed = value in enum_values
+            if not allowed:
+                result.add_error(
+                    field_path,
+                    f"Value must be one of {enum_values}, got {value}",
+                    value,
+                )
+
+        checks.append(check_enum)
+
+    pattern = schema.get("pattern")
+    pattern_re = _compiled_pattern(pattern) if pattern else None
+    min_length = schema.get("minLength")
+    max_length = schema.get("maxLength")
+    if pattern_re is not None or min_length is not None or max_length is not None:
+
+        def check_string(
+            value: Any, field_path: str, result: ValidationResult, stack: CheckStack
+        ) -> None:
+            if not isinstance(value, str):
+                return
+            if pattern_re is not None and not pattern_re.match(value):
+                result.add_error(
+                    field_path, f"Value does not match pattern: {pattern}", value
+                )
+            if min_length is not None and len(value) < min_length:
+                result.add_error(
+                    field_path,
+                    f"String must be at least {min_length} characters, got {len(value)}",
+                    value,
+                )
+            if max_length is not None and len(value) > max_length:
+                result.add_error(
+                    field_path,
+                    f"String must be at most {max_length} characters, got {len(value)}",
+                    value,
+                )
+
+        checks.append(check_string)
+
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+    if minimum is not None or maximum is not None:
+
+        def check_number(
+            value: Any, field_path: str, result: ValidationResult, stack: CheckStack
+        ) -> None:
+            if not isinstance(value, (int, float)):
+                return
+            if minimum is not None and value < minimum:
+                result.add_error(
+                    field_path, f"Value must be at least {minimum}, got {value}", value
+                )
+            if maximum is not None and value > maximum:
+                result.add_error(
+                    field_path, f"Value must be at most {maximum}, got {value}", value
+                )
+
+        checks.append(check_number)
+
+    nested = None
+    if field_type == "object":
+        nested = _compile_object(schema)
+    elif field_type == "array":
+        nested = _compile_array(schema)
+    if nested is not None:
+
+        def check_nested(
+            value: Any, field_path: str, result: ValidationResult, stack: CheckStack
+        ) -> None:
+            if isinstance(value, expected):
+                nested(value, field_path, result, stack)
+
+        checks.append(check_nested)
+
+    if not checks:
+        return lambda value, field_path, result, stack: None
+    return _run_all(checks)
+
+
+def _queues_children(schema: Dict[str, Any]) -> bool:
+    """Whether a compiled check for schema may push nested values."""
+    return schema.get("type", "string") in ("object", "array")
+
+
+def _compile_object(schema: Dict[str, Any]) -> FieldCheck:
+    """Compile the body of validate_object for a value known to be a dict."""
+    properties = schema.get("properties", {})
+    # Schema order is kept for reporting; the set does the membership test
+    required_order = tuple(dict.fromkeys(schema.get("required", ())))
+    required = frozenset(required_order)
+    additional = schema.get("additionalProperties", True)
+    known_keys = frozenset(properties)
+
+    # Property checks are compiled on first use, so compiling a deeply nested
+    # schema does not recurse either. Each carries whether it may queue
+    # children; the others run in place, as long as that keeps error order.
+    property_checks: Optional[Tuple[Tuple[str, FieldCheck, bool], ...]] = None
+    additional_check: FieldCheck = _reject_additional
+    additional_nested = False
+
+    def check_object(
+        obj: Dict[str, Any],
+        field_path: str,
+        result: ValidationResult,
+        stack: CheckStack,
+    ) -> None:
+        nonlocal property_checks, additional_check, additional_nested
+        if property_checks is None:
+            if additional is not True and additional is not False:
+                additional_check = _compile_field(additional)
+                additional_nested = _queues_children(additional)
+            property_checks = tuple(
+                (name, _compile_field(prop_schema), _queues_children(prop_schema))
+                for name, prop_schema in properties.items()
+            )
+
+        # One C-level set operation; usually nothing is missing
+        missing = required.difference(obj)
+        if missing:
+            for name in required_order:
+                if name in missing:
+                    result.add_error(
+                        f"{field_path}.{name}", "Required field is missing"
+                    )
+
+        # Look up each known property directly rather than dispatching per key.
+        # From the first nested value on, everything is queued so errors
+        # still come out in order.
+        queued: Optional[CheckStack] = None
+        for name, prop_check, nested in property_checks:
+            if name in obj:
+                if queued is not None:
+                    queued.append((prop_check, obj[name], f"{field_path}.{name}"))
+                elif nested:
+                    queued = [(prop_check, obj[name], f"{field_path}.{name}")]
+                else:
+                    prop_check(obj[name], f"{field_path}.{name}", result, stack)
+
+        if additional is not True:
+            unknown = obj.keys() - known_keys
+            if unknown:
+                for name, value in obj.items():
+                    if name not in unknown:
+                        continue
+                    if queued is not None:
+                        queued.append((additional_check, value, f"{field_path}.{name}"))
+                    elif additional_nested:
+                        queued = [(additional_check, value, f"{field_path}.{name}")]
+                    else:
+                        additional_check(value, f"{field_path}.{name}", result, stack)
+
+        if queued is not None:
+            queued.reverse()
+            stack.extend(queued)
+
+    return check_object
+
+
+def _compile_array(schema: Dict[str, Any]) -> FieldCheck:
+    """Compile the body of validate_array for a value known to be a list."""
+    min_items = schema.get("minItems")
+    max_items = schema.get("maxItems")
+    items_schema = schema.get("items", {})
+    items_nested = _queues_children(items_schema)
+    # Compiled on first use, as in _compile_object
+    item_check: Optional[FieldCheck] = None
+
+    def check_array(
+        arr: List[Any], field_path: str, result: ValidationResult, stack: CheckStack
+    ) -> None:
+        nonlocal item_check
+        if min_items is not None and len(arr) < min_items:
+            result.add_error(
+                field_path,
+                f"Array must have at least {min_items} items, got {len(arr)}",
+            )
+        if max_items is not None and len(arr) > max_items:
+            result.add_error(
+                field_path, f"Array must have at most {max_items} items, got {len(arr)}"
+            )
+        if not items_schema:
+            return
+        if item_check is None:
+            item_check = _compile_field(items_schema)
+        if items_nested:
+            stack.extend(
+                [
+                    (item_check, arr[i], f"{field_path}[{i}]")
+                    for i in range(len(arr) - 1, -1, -1)
+                ]
+            )
+        else:
+            for i, item in enumerate(arr):
+                item_check(item, f"{field_path}[{i}]", result, stack)
+
+    return check_array
+
+
+def _compile_headers(headers_schema: Dict[str, Any]) -> RequestCheck:
+    """Compile header validation with schema names lowercased up front."""
+    required = [
+        (name, name.lower())
+        for name, header_def in headers_schema.items()
+        if header_def.get("required", False)
+    ]
+    # lowercased name -> (schema name, check); the first spelling wins
+    by_lower: Dict[str, Tuple[str, FieldCheck]] = {}
+    for name, header_def in headers_schema.items():
+        if header_def:
+            by_lower.setdefault(name.lower(), (name, _compile_field(header_def)))
+
+    def check_headers(headers, query_params, body, result: ValidationResult):
+        present = {name.lower() for name in headers}
+        for name, name_lower in required:
+            if name_lower not in present:
+                result.add_error(f"headers.{name}", "Required header is missing")
+
+        for name, value in headers.items():
+            entry = by_lower.get(name.lower())
+            if entry is not None:
+                _run_check(entry[1], value, f"headers.{entry[0]}", result)
+            else:
+                result.add_warning(f"Unexpected header: {name}")
+
+    return check_headers
+
+
+def _compile_query_params(query_schema: Dict[str, Any]) -> RequestCheck:
+    """Compile query parameter validation."""
+    required = [
+        name
+        for name, param_def in query_schema.items()
+        if param_def.get("required", False)
+    ]
+    params = {
+        name: _compile_field(param_def) for name, param_def in query_schema.items()
+    }
+
+    def check_query_params(headers, query_params, body, result: ValidationResult):
+        for name in required:
+            if name not in query_params:
+                result.add_error(f"query.{name}", "Required query parameter is missing")
+
+        for name, value in query_params.items():
+            param_check = params.get(name)
+            if param_check is not None:
+                _run_check(param_check, value, f"query.{name}", result)
+            else:
+                result.add_warning(f"Unexpected query parameter: {name}")
+
+    return check_query_params
+
+
+def _msgspec_type(schema: Dict[str, Any], default_type: str = "string") -> Any:
+    """
+    Translate a field schema into a msgspec type accepting exactly what
+    the compiled checks accept.
+
+    Returns None when the schema uses a feature with no exact msgspec
+    equivalent (enums, schema-valued additionalProperties, ...).
+    """
+    field_type = schema.get("type", default_type)
+    if schema.get("enum"):
+        return None
+
+    meta: Dict[str, Any] = {}
+    if field_type == "string":
+        if schema.get("pattern"):
+            # msgspec searches; the compiled check matches from the start
+            meta["pattern"] = f"^(?:{schema['pattern']})"
+        if schema.get("minLength") is not None:
+            meta["min_length"] = schema["minLength"]
+        if schema.get("maxLength") is not None:
+            meta["max_length"] = schema["maxLength"]
+        return Annotated[str, msgspec.Meta(**meta)] if meta else str
+
+    if field_type in ("integer", "number"):
+        if schema.get("minimum") is not None:
+            meta["ge"] = schema["minimum"]
+        if schema.get("maximum") is not None:
+            meta["le"] = schema["maximum"]
+        base = int if field_type == "integer" else float
+        return Annotated[base, msgspec.Meta(**meta)] if meta else base
+
+    if field_type == "boolean":
+        # bool is an int to the number checks, which msgspec cannot express
+        if schema.get("minimum") is not None or schema.get("maximum") is not None:
+            return None
+        return bool
+
+    if field_type == "array":
+        items_schema = schema.get("items", {})
+        item_type = _msgspec_type(items_schema) if items_schema else Any
+        if item_type is None:
+            return None
+        if schema.get("minItems") is not None:
+            meta["min_length"] = schema["minItems"]
+        if schema.get("maxItems") is not None:
+            meta["max_length"] = schema["maxItems"]
+        # item_type is only known at runtime; going through Any keeps mypy
+        # from reading this as a static type
+        array_type = cast(Any, List)[item_type]
+        return Annotated[array_type, msgspec.Meta(**meta)] if meta else array_type
+
+    if field_type == "object":
+        additional = schema.get("additionalProperties", True)
+        if additional is not True and additional is not False:
+            return None
+        required = dict.fromkeys(schema.get("required", ()))
+        properties = schema.get("properties", {})
+        if additional is False and any(name not in properties for name in required):
+            # Such a name is both required and rejected as undeclared; leave
+            # the reporting to the Python checks
+            return None
+        fields, rename = [], {}
+        for name in {**properties, **required}:
+            prop_type = _msgspec_type(properties[name]) if name in properties else Any
+            if prop_type is None:
+                return None
+            # Field names may not be identifiers; rename maps them back
+            attr = f"f{len(fields)}"
+            rename[attr] = name
+            if name in required:
+                fields.append((attr, prop_type))
+            else:
+                fields.append(
+                    (attr, Union[prop_type, msgspec.UnsetType], msgspec.UNSET)
+                )
+        return msgspec.defstruct(
+            "Body",
+            fields,
+            rename=rename,
+            kw_only=True,
+            forbid_unknown_fields=additional is False,
+        )
+
+    # Unknown types are only constrained by checks on the value's own type
+    constrained = (
+        "pattern",
+        "minLength",
+        "maxLength",
+        "minimum",
+        "maximum",
+        "minItems",
+        "maxItems",
+    )
+    if any(schema.get(key) is not None for key in constrained):
+        return None
+    return Any
+
+
+def _msgspec_decoder(body_schema: Dict[str, Any]) -> Optional[Any]:
+    """Build a JSON decoder for a body schema, or None if none is exact."""
+    try:
+        body_type = _msgspec_type(body_schema, default_type="object")
+        return msgspec.json.Decoder(body_type) if body_type is not None else None
+    except (TypeError, ValueError, re.error, RecursionError):
+        # Constraints msgspec cannot represent, e.g. a pattern with inline
+        # flags, which is no longer valid once anchored, or nesting too deep
+        # to build types for
+        return None
+
+
+def _compile_body(
+    body_schema: Dict[str, Any], use_msgspec: bool = False
+) -> RequestCheck:
+    """Compile body validation equivalent to validate_body."""
+    body_required = body_schema.get("required", False)
+    schema_type = body_schema.get("type", "object")
+    decoder = _msgspec_decoder(body_schema) if use_msgspec else None
+    if schema_type == "object":
+        expected, shape_check = dict, _compile_object(body_schema)
+    elif schema_type == "array":
+        expected, shape_check = list, _compile_array(body_schema)
+    else:
+        expected, shape_check = None, _compile_field(body_schema)
+
+    def check_body(headers, query_params, body, result: ValidationResult):
+        if body is None:
+            if body_required:
+                result.add_error("body", "Request body is required")
+            return
+
+        if isinstance(body, str):
+            if decoder is not None:
+                # Valid bodies are accepted in one pass without building
+                # Python objects; anything else is re-checked below so the
+                # errors reported are the usual ones.
+                try:
+                    decoder.decode(body)
+                    return
+                except msgspec.MsgspecError:
+                    pass
+            try:
+                body = json_loads(body)
+            except ValueError:
+                result.add_error("body", "Request body must be valid JSON")
+                return
+
+        if expected is not None and not isinstance(body, expected):
+            result.add_error(
+                "body", f"Expected {schema_type}, got {type(body).__name__}"
+            )
+            return
+
+        _run_check(shape_check, body, "body", result)
+
+    return check_body
+
+
+class _CompiledValidator:
+    """An endpoint's compiled request checks, run in order."""
+
+    __slots__ = ("checks", "uses_msgspec")
+
+    def __init__(self, checks: List[RequestCheck], uses_msgspec: bool):
+        self.checks = checks
+        # Whether the body check was compiled with the msgspec fast path
+        self.uses_msgspec = uses_msgspec
+
+    def __call__(self, headers, query_params, body, result: ValidationResult) -> None:
+        for check in self.checks:
+            check(headers, query_params, body, result)
+
+
+def _warn_unexpected_body(headers, query_params, body, result: ValidationResult):
+    """Warn about a body sent to an endpoint that does not take one."""
+    if body:
+        result.add_warning("Request body provided but not expected by schema")
+
+
 class RequestValidator:
     """Validates HTTP requests against API schemas."""
 
-    def __init__(self):
-        """Initialize request validator."""
-        pass
+    def __init__(self, use_msgspec: bool = False):
+        """
+        Initialize request validator.
+
+        Args:
+            use_msgspec: Check raw JSON bodies with msgspec before falling
+                back to the Python checks. Ignored if msgspec is not installed.
+        """
+        self.use_msgspec = use_msgspec and msgspec is not None
 
     def validate_request(
         self,
@@ -89,89 +664,148 @@ class RequestValidator:
                 "method", f"Expected {endpoint.method}, got {method.upper()}"
             )
 
-        # Validate headers
-        if endpoint.headers:
-            header_result = self.validate_headers(endpoint.headers, headers or {})
-            result.errors.extend(header_result.errors)
-            result.warnings.extend(header_result.warnings)
-
-        # Validate query parameters
-        if endpoint.query_params:
-            query_result = self.validate_query_params(
-                endpoint.query_params, query_params or {}
-            )
-            result.errors.extend(query_result.errors)
-            result.warnings.extend(query_result.warnings)
-
-        # Validate request body
-        if endpoint.body_schema:
-            body_result = self.validate_body(endpoint.body_schema, body)
-            result.errors.extend(body_result.errors)
-            result.warnings.extend(body_result.warnings)
-        elif body:
-            result.add_warning("Request body provided but not expected by schema")
+        # Validate headers, query parameters and body
+        validate = self._compiled_validator(endpoint)
+        validate(headers or {}, query_params or {}, body, result)
 
         # Validate path parameters
         if path:
-            path_result = self.validate_path_parameters(endpoint.path, path)
-            result.errors.extend(path_result.errors)
-
-        # Update overall validity
-        result.is_valid = len(result.errors) == 0
+            self.validate_path_parameters(endpoint.path, path, result)
 
         # Add suggestions
         self._add_suggestions(result, endpoint, headers, query_params, body)
 
         return result
 
+    def validate_many(
+        self,
+        endpoint: SchemaEndpoint,
+        cases: Iterable[Dict[str, Any]],
+        method: Optional[str] = None,
+    ) -> List[ValidationResult]:
+        """
+        Validate several requests against the same endpoint.
+
+        The endpoint's compiled validator and the method check are resolved
+        once for the whole batch instead of once per request.
+
+        Args:
+            endpoint: SchemaEndpoint to validate against
+            cases: Requests as dicts with optional "headers", "query_params",
+                "body" and "path" keys, as accepted by validate_request
+            method: HTTP method shared by all requests (optional)
+
+        Returns:
+            One ValidationResult per case, in order
+        """
+        validate = self._compiled_validator(endpoint)
+
+        method_error = None
+        if method and method.upper() != endpoint.method:
+            method_error = f"Expected {endpoint.method}, got {method.upper()}"
+
+        results = []
+        for case in cases:
+            headers = case.get("headers")
+            query_params = case.get("query_params")
+            body = case.get("body")
+            path = case.get("path")
+
+            result = ValidationResult()
+            if method_error:
+                result.add_error("method", method_error)
+            validate(headers or {}, query_params or {}, body, result)
+            if path:
+                self.validate_path_parameters(endpoint.path, path, result)
+            self._add_suggestions(result, endpoint, headers, query_params, body)
+            results.append(result)
+
+        return results
+
+    def _compiled_validator(self, endpoint: SchemaEndpoint) -> _CompiledValidator:
+        """Get the endpoint's cached validator, compiling it if needed."""
+        validate = endpoint._compiled_validator
+        if validate is None or validate.uses_msgspec != self.use_msgspec:
+            validate = self.compile_validator(endpoint)
+        return validate
+
+    def compile_validator(self, endpoint: SchemaEndpoint) -> _CompiledValidator:
+        """
+        Compile an endpoint's schemas into a specialized validator.
+
+        The schema dicts are walked once, keeping only the checks they
+        actually declare, with patterns compiled and header names lowercased
+        up front. The result is cached on the endpoint, so the endpoint's
+        schemas should not be modified after it has been validated.
+
+        Args:
+            endpoint: SchemaEndpoint to compile
+
+        Returns:
+            Function taking (headers, query_params, body, result)
+        """
+        checks: List[RequestCheck] = []
+        if endpoint.headers:
+            checks.append(_compile_headers(endpoint.headers))
+        if endpoint.query_params:
+            checks.append(_compile_query_params(endpoint.query_params))
+        if endpoint.body_schema:
+            checks.append(_compile_body(endpoint.body_schema, self.use_msgspec))
+        else:
+            checks.append(_warn_unexpected_body)
+
+        validate = _CompiledValidator(checks, self.use_msgspec)
+        endpoint._compiled_validator = validate
+        return validate
+
     def validate_headers(
-        self, headers_schema: Dict[str, Any], headers: Dict[str, str]
+        self,
+        headers_schema: Dict[str, Any],
+        headers: Dict[str, str],
+        result: Optional[ValidationResult] = None,
     ) -> ValidationResult:
         """Validate request headers against schema."""
-        result = ValidationResult()
+        if result is None:
+            result = ValidationResult()
+
+        # Header names are case-insensitive; lowercase each name once
+        present = {header_name.lower() for header_name in headers}
+        schema_by_lower: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        for header_name, header_def in headers_schema.items():
+            schema_by_lower.setdefault(header_name.lower(), (header_name, header_def))
 
         # Check required headers
         for header_name, header_def in headers_schema.items():
             if header_def.get("required", False):
-                # Case-insensitive header lookup
-                header_found = False
-                for actual_header in headers.keys():
-                    if actual_header.lower() == header_name.lower():
-                        header_found = True
-                        break
-
-                if not header_found:
+                if header_name.lower() not in present:
                     result.add_error(
                         f"headers.{header_name}", "Required header is missing"
                     )
 
         # Validate header values
         for header_name, header_value in headers.items():
-            # Find matching schema (case-insensitive)
-            schema_def = None
-            schema_name = None
-            for schema_header_name, schema_header_def in headers_schema.items():
-                if schema_header_name.lower() == header_name.lower():
-                    schema_def = schema_header_def
-                    schema_name = schema_header_name
-                    break
+            schema_name, schema_def = schema_by_lower.get(
+                header_name.lower(), (None, None)
+            )
 
             if schema_def:
-                field_result = self.validate_field_value(
-                    f"headers.{schema_name}", header_value, schema_def
+                self.validate_field_value(
+                    f"headers.{schema_name}", header_value, schema_def, result
                 )
-                result.errors.extend(field_result.errors)
-                result.warnings.extend(field_result.warnings)
             else:
                 result.add_warning(f"Unexpected header: {header_name}")
 
         return result
 
     def validate_query_params(
-        self, query_schema: Dict[str, Any], query_params: Dict[str, str]
+        self,
+        query_schema: Dict[str, Any],
+        query_params: Dict[str, str],
+        result: Optional[ValidationResult] = None,
     ) -> ValidationResult:
         """Validate query parameters against schema."""
-        result = ValidationResult()
+        if result is None:
+            result = ValidationResult()
 
         # Check required parameters
         for param_name, param_def in query_schema.items():
@@ -183,21 +817,23 @@ class RequestValidator:
         # Validate parameter values
         for param_name, param_value in query_params.items():
             if param_name in query_schema:
-                field_result = self.validate_field_value(
-                    f"query.{param_name}", param_value, query_schema[param_name]
+                self.validate_field_value(
+                    f"query.{param_name}", param_value, query_schema[param_name], result
                 )
-                result.errors.extend(field_result.errors)
-                result.warnings.extend(field_result.warnings)
             else:
                 result.add_warning(f"Unexpected query parameter: {param_name}")
 
         return result
 
     def validate_body(
-        self, body_schema: Dict[str, Any], body: Optional[Union[Dict[str, Any], str]]
+        self,
+        body_schema: Dict[str, Any],
+        body: Optional[Union[Dict[str, Any], str]],
+        result: Optional[ValidationResult] = None,
     ) -> ValidationResult:
         """Validate request body against schema."""
-        result = ValidationResult()
+        if result is None:
+            result = ValidationResult()
 
         if body is None:
             # Check if body is required
@@ -208,8 +844,8 @@ class RequestValidator:
         # If body is a string, try to parse as JSON
         if isinstance(body, str):
             try:
-                body = json.loads(body)
-            except json.JSONDecodeError:
+                body = json_loads(body)
+            except ValueError:
                 result.add_error("body", "Request body must be valid JSON")
                 return result
 
@@ -217,199 +853,264 @@ class RequestValidator:
         schema_type = body_schema.get("type", "object")
 
         if schema_type == "object":
-            object_result = self.validate_object(body, body_schema, "body")
-            result.errors.extend(object_result.errors)
-            result.warnings.extend(object_result.warnings)
+            self.validate_object(body, body_schema, "body", result)
         elif schema_type == "array":
-            array_result = self.validate_array(body, body_schema, "body")
-            result.errors.extend(array_result.errors)
-            result.warnings.extend(array_result.warnings)
+            self.validate_array(body, body_schema, "body", result)
         else:
-            field_result = self.validate_field_value("body", body, body_schema)
-            result.errors.extend(field_result.errors)
-            result.warnings.extend(field_result.warnings)
+            self.validate_field_value("body", body, body_schema, result)
 
         return result
 
     def validate_object(
-        self, obj: Any, schema: Dict[str, Any], field_path: str
+        self,
+        obj: Any,
+        schema: Dict[str, Any],
+        field_path: str,
+        result: Optional[ValidationResult] = None,
     ) -> ValidationResult:
         """Validate object against object schema."""
-        result = ValidationResult()
+        if result is None:
+            result = ValidationResult()
 
         if not isinstance(obj, dict):
             result.add_error(field_path, f"Expected object, got {type(obj).__name__}")
             return result
 
-        properties = schema.get("properties", {})
-        required_fields = set(schema.get("required", []))
-
-        # Check required fields
-        for required_field in required_fields:
-            if required_field not in obj:
-                result.add_error(
-                    f"{field_path}.{required_field}", "Required field is missing"
-                )
-
-        # Validate each property
-        for prop_name, prop_value in obj.items():
-            if prop_name in properties:
-                prop_schema = properties[prop_name]
-                prop_result = self.validate_field_value(
-                    f"{field_path}.{prop_name}", prop_value, prop_schema
-                )
-                result.errors.extend(prop_result.errors)
-                result.warnings.extend(prop_result.warnings)
-            else:
-                # Check if additional properties are allowed
-                additional_properties = schema.get("additionalProperties", True)
-                if additional_properties is False:
-                    result.add_error(
-                        f"{field_path}.{prop_name}", "Additional property not allowed"
-                    )
-                elif additional_properties is not True:
-                    # Additional properties have a schema
-                    prop_result = self.validate_field_value(
-                        f"{field_path}.{prop_name}", prop_value, additional_properties
-                    )
-                    result.errors.extend(prop_result.errors)
-                    result.warnings.extend(prop_result.warnings)
-
+        self._validate_object_fields(obj, schema, field_path, result)
         return result
 
+    def _validate_object_fields(
+        self,
+        obj: Dict[str, Any],
+        schema: Dict[str, Any],
+        field_path: str,
+        result: ValidationResult,
+    ) -> None:
+        """Validate the fields of a value already known to be a dict."""
+        stack: List[Tuple[str, Any, Optional[Dict[str, Any]]]] = []
+        self._push_object_fields(obj, schema, field_path, result, stack)
+        self._validate_stack(stack, result)
+
     def validate_array(
-        self, arr: Any, schema: Dict[str, Any], field_path: str
+        self,
+        arr: Any,
+        schema: Dict[str, Any],
+        field_path: str,
+        result: Optional[ValidationResult] = None,
     ) -> ValidationResult:
         """Validate array against array schema."""
-        result = ValidationResult()
+        if result is None:
+            result = ValidationResult()
 
         if not isinstance(arr, list):
             result.add_error(field_path, f"Expected array, got {type(arr).__name__}")
             return result
 
-        # Check array constraints
-        min_items = schema.get("minItems")
-        max_items = schema.get("maxItems")
-
-        if min_items is not None and len(arr) < min_items:
-            result.add_error(
-                field_path,
-                f"Array must have at least {min_items} items, got {len(arr)}",
-            )
-
-        if max_items is not None and len(arr) > max_items:
-            result.add_error(
-                field_path, f"Array must have at most {max_items} items, got {len(arr)}"
-            )
-
-        # Validate items
-        items_schema = schema.get("items", {})
-        if items_schema:
-            for i, item in enumerate(arr):
-                item_result = self.validate_field_value(
-                    f"{field_path}[{i}]", item, items_schema
-                )
-                result.errors.extend(item_result.errors)
-                result.warnings.extend(item_result.warnings)
-
+        self._validate_array_items(arr, schema, field_path, result)
         return result
 
+    def _validate_array_items(
+        self,
+        arr: List[Any],
+        schema: Dict[str, Any],
+        field_path: str,
+        result: ValidationResult,
+    ) -> None:
+        """Validate the items of a value already known to be a list."""
+        stack: List[Tuple[str, Any, Optional[Dict[str, Any]]]] = []
+        self._push_array_items(arr, schema, field_path, result, stack)
+        self._validate_stack(stack, result)
+
     def validate_field_value(
-        self, field_path: str, value: Any, schema: Dict[str, Any]
+        self,
+        field_path: str,
+        value: Any,
+        schema: Dict[str, Any],
+        result: Optional[ValidationResult] = None,
     ) -> ValidationResult:
         """Validate a single field value against its schema."""
-        result = ValidationResult()
+        if result is None:
+            result = ValidationResult()
 
-        field_type = schema.get("type", "string")
-        enum_values = schema.get("enum")
-        pattern = schema.get("pattern")
-        min_length = schema.get("minLength")
-        max_length = schema.get("maxLength")
-        minimum = schema.get("minimum")
-        maximum = schema.get("maximum")
+        self._validate_stack([(field_path, value, schema)], result)
+        return result
 
-        # Type validation
-        if field_type == "string" and not isinstance(value, str):
-            result.add_error(
-                field_path, f"Expected string, got {type(value).__name__}", value
-            )
-        elif field_type == "integer" and not isinstance(value, int):
-            result.add_error(
-                field_path, f"Expected integer, got {type(value).__name__}", value
-            )
-        elif field_type == "number" and not isinstance(value, (int, float)):
-            result.add_error(
-                field_path, f"Expected number, got {type(value).__name__}", value
-            )
-        elif field_type == "boolean" and not isinstance(value, bool):
-            result.add_error(
-                field_path, f"Expected boolean, got {type(value).__name__}", value
-            )
-        elif field_type == "array" and not isinstance(value, list):
-            result.add_error(
-                field_path, f"Expected array, got {type(value).__name__}", value
-            )
-        elif field_type == "object" and not isinstance(value, dict):
-            result.add_error(
-                field_path, f"Expected object, got {type(value).__name__}", value
-            )
+    def _validate_stack(
+        self,
+        stack: List[Tuple[str, Any, Optional[Dict[str, Any]]]],
+        result: ValidationResult,
+    ) -> None:
+        """
+        Validate (field_path, value, schema) items until the stack is empty.
 
-        # Enum validation
-        if enum_values and value not in enum_values:
-            result.add_error(
-                field_path, f"Value must be one of {enum_values}, got {value}", value
+        Objects and arrays push their children instead of recursing, so deeply
+        nested bodies cannot hit the recursion limit. Children are pushed in
+        reverse so errors are still reported in document order. A schema of
+        None marks a property rejected by additionalProperties: false.
+        """
+        while stack:
+            field_path, value, schema = stack.pop()
+            if schema is None:
+                result.add_error(field_path, "Additional property not allowed")
+                continue
+
+            # Constraints are looked up only for the kind of value that uses them
+            field_type = schema.get("type", "string")
+
+            # Type validation
+            type_check = _JSON_TYPES.get(field_type)
+            type_ok = type_check is None or (
+                isinstance(value, type_check[0])
+                and not (type_check[1] and value.__class__ is bool)
             )
-
-        # String-specific validations
-        if isinstance(value, str):
-            if pattern and not re.match(pattern, value):
-                result.add_error(
-                    field_path, f"Value does not match pattern: {pattern}", value
-                )
-
-            if min_length is not None and len(value) < min_length:
+            if not type_ok:
                 result.add_error(
                     field_path,
-                    f"String must be at least {min_length} characters, got {len(value)}",
+                    f"Expected {field_type}, got {type(value).__name__}",
                     value,
                 )
 
-            if max_length is not None and len(value) > max_length:
+            # Enum validation
+            enum_values = schema.get("enum")
+            if enum_values and value not in enum_values:
                 result.add_error(
                     field_path,
-                    f"String must be at most {max_length} characters, got {len(value)}",
+                    f"Value must be one of {enum_values}, got {value}",
                     value,
                 )
 
-        # Numeric validations
-        if isinstance(value, (int, float)):
-            if minimum is not None and value < minimum:
-                result.add_error(
-                    field_path, f"Value must be at least {minimum}, got {value}", value
-                )
+            # String-specific validations
+            if isinstance(value, str):
+                pattern = schema.get("pattern")
+                min_length = schema.get("minLength")
+                max_length = schema.get("maxLength")
 
-            if maximum is not None and value > maximum:
+                if pattern and not _compiled_pattern(pattern).match(value):
+                    result.add_error(
+                        field_path,
+                        f"Value does not match pattern: {pattern}",
+                        value,
+                    )
+
+                if min_length is not None and len(value) < min_length:
+                    result.add_error(
+                        field_path,
+                        f"String must be at least {min_length} characters, got {len(value)}",
+                        value,
+                    )
+
+                if max_length is not None and len(value) > max_length:
+                    result.add_error(
+                        field_path,
+                        f"String must be at most {max_length} characters, got {len(value)}",
+                        value,
+                    )
+
+            # Numeric validations
+            elif isinstance(value, (int, float)):
+                minimum = schema.get("minimum")
+                maximum = schema.get("maximum")
+
+                if minimum is not None and value < minimum:
+                    result.add_error(
+                        field_path,
+                        f"Value must be at least {minimum}, got {value}",
+                        value,
+                    )
+
+                if maximum is not None and value > maximum:
+                    result.add_error(
+                        field_path,
+                        f"Value must be at most {maximum}, got {value}",
+                        value,
+                    )
+
+            # Nested values; the type check above already confirmed the shape
+            if type_ok:
+                if field_type == "object":
+                    self._push_object_fields(value, schema, field_path, result, stack)
+                elif field_type == "array":
+                    self._push_array_items(value, schema, field_path, result, stack)
+
+    def _push_object_fields(
+        self,
+        obj: Dict[str, Any],
+        schema: Dict[str, Any],
+        field_path: str,
+        result: ValidationResult,
+        stack: List[Tuple[str, Any, Optional[Dict[str, Any]]]],
+    ) -> None:
+        """Check an object's required fields and queue its properties."""
+        properties = schema.get("properties", {})
+
+        # Check required fields
+        for required_field in schema.get("required", ()):
+            if required_field not in obj:
                 result.add_error(
-                    field_path, f"Value must be at most {maximum}, got {value}", value
+                    f"{field_path}.{required_field}", "Required field is missing"
                 )
 
-        # Recursive validation for objects and arrays
-        if field_type == "object" and isinstance(value, dict):
-            object_result = self.validate_object(value, schema, field_path)
-            result.errors.extend(object_result.errors)
-            result.warnings.extend(object_result.warnings)
-        elif field_type == "array" and isinstance(value, list):
-            array_result = self.validate_array(value, schema, field_path)
-            result.errors.extend(array_result.errors)
-            result.warnings.extend(array_result.warnings)
+        # Check if additional properties are allowed
+        additional_properties = schema.get("additionalProperties", True)
 
-        return result
+        children = []
+        for prop_name, prop_value in obj.items():
+            if prop_name in properties:
+                prop_schema = properties[prop_name]
+            elif additional_properties is False:
+                prop_schema = None
+            elif additional_properties is not True:
+                # Additional properties have a schema
+                prop_schema = additional_properties
+            else:
+                continue
+            children.append((f"{field_path}.{prop_name}", prop_value, prop_schema))
+
+        stack.extend(reversed(children))
+
+    def _push_array_items(
+        self,
+        arr: List[Any],
+        schema: Dict[str, Any],
+        field_path: str,
+        result: ValidationResult,
+        stack: List[Tuple[str, Any, Optional[Dict[str, Any]]]],
+    ) -> None:
+        """Check an array's size constraints and queue its items."""
+        min_items = schema.get("minItems")
+        max_items = schema.get("maxItems")
+
+        if min_items is not None and len(arr) < min_items:
+            result.add_error(
+                field_path,
+                f"Array must have at least {min_items} items, got {len(arr)}",
+            )
+
+        if max_items is not None and len(arr) > max_items:
+            result.add_error(
+                field_path, f"Array must have at most {max_items} items, got {len(arr)}"
+            )
+
+        items_schema = schema.get("items", {})
+        if items_schema:
+            stack.extend(
+                (f"{field_path}[{i}]", arr[i], items_schema)
+                for i in range(len(arr) - 1, -1, -1)
+            )
 
     def validate_path_parameters(
-        self, schema_path: str, actual_path: str
+        self,
+        schema_path: str,
+        actual_path: str,
+        result: Optional[ValidationResult] = None,
     ) -> ValidationResult:
         """Validate path parameters by comparing schema path with actual path."""
-        result = ValidationResult()
+        if result is None:
+            result = ValidationResult()
+
+        # A matching path has nothing to report; only mismatches are diagnosed
+        if _path_pattern(schema_path).fullmatch(actual_path):
+            return result
 
         schema_parts = schema_path.strip("/").split("/")
         actual_parts = actual_path.strip("/").split("/")
@@ -474,96 +1175,37 @@ class RequestValidator:
 
     def get_validation_summary(self, result: ValidationResult) -> str:
         """Get a detailed validation summary for display."""
-        lines = [result.get_summary()]
+        buf = io.StringIO()
+        write = buf.write
+        write(result.get_summary())
 
         if result.errors:
-            lines.append("\n❌ Errors:")
+            write("\n\n❌ Errors:")
             for error in result.errors:
-                lines.append(f"  • {error.field}: {error.message}")
+                write("\n  • ")
+                write(error.field)
+                write(": ")
+                write(error.message)
                 if error.value is not None:
-                    lines.append(f"    Got: {error.value}")
+                    write("\n    Got: ")
+                    write(str(error.value))
 
         if result.warnings:
-            lines.append("\n⚠️  Warnings:")
+            write("\n\n⚠️  Warnings:")
             for warning in result.warnings:
-                lines.append(f"  • {warning}")
+                write("\n  • ")
+                write(warning)
 
         if result.suggestions:
-            lines.append("\n💡 Suggestions:")
+            write("\n\n💡 Suggestions:")
             for suggestion in result.suggestions:
-                lines.append(f"  • {suggestion}")
-
-        return "\n".join(lines)
-
-
-def demo_validator():
-    """Demo function to show validator functionality."""
-    print("✅ VALIDATION ENGINE DEMO")
-    print("=" * 50)
-
-    validator = RequestValidator()
-
-    # Create a sample endpoint schema
-    from .schema_loader import SchemaEndpoint
-
-    endpoint = SchemaEndpoint(
-        method="POST",
-        path="/users",
-        headers={
-            "Authorization": {"type": "string", "required": True},
-            "Content-Type": {"type": "string", "enum": ["application/json"]},
-        },
-        query_params={"validate": {"type": "boolean", "default": False}},
-        body_schema={
-            "type": "object",
-            "properties": {
-                "username": {"type": "string", "minLength": 3},
-                "email": {"type": "string", "pattern": r"^[^@]+@[^@]+\.[^@]+$"},
-                "age": {"type": "integer", "minimum": 0, "maximum": 150},
-            },
-            "required": ["username", "email"],
-        },
-    )
-
-    print("✅ Sample endpoint schema created")
-    print(f"Method: {endpoint.method}")
-    print(f"Path: {endpoint.path}")
-    print(
-        f"Required headers: {[h for h, d in endpoint.headers.items() if d.get('required')]}"
-    )
-    print(f"Required body fields: {endpoint.body_schema.get('required', [])}")
-
-    # Test valid request
-    print("\n🔧 Testing valid request:")
-    valid_headers = {
-        "Authorization": "Bearer token123",
-        "Content-Type": "application/json",
-    }
-    valid_body = {"username": "johndoe", "email": "john@example.com", "age": 25}
-
-    result = validator.validate_request(
-        endpoint=endpoint, headers=valid_headers, body=valid_body, method="POST"
-    )
+                write("\n  • ")
+                write(suggestion)
 
-    print(f"Valid request result: {result.get_summary()}")
-
-    # Test invalid request
-    print("\n🔧 Testing invalid request:")
-    invalid_headers = {"Content-Type": "application/json"}  # Missing Authorization
-    invalid_body = {
-        "username": "jo",
-        "email": "invalid-email",
-    }  # Short username, invalid email
-
-    result = validator.validate_request(
-        endpoint=endpoint, headers=invalid_headers, body=invalid_body, method="POST"
-    )
-
-    print(f"Invalid request result: {result.get_summary()}")
-    print(f"Errors: {len(result.errors)}")
-    for error in result.errors:
-        print(f"  • {error.field}: {error.message}")
+        return buf.getvalue()
 
 
 if __name__ == "__main__":
+    from ._demo_validator import demo_validator
+
     demo_validator()
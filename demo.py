@@ -4,154 +4,167 @@ Demo script showing apicrafter functionality.
 This demonstrates the core features without requiring full installation.
 """
 
+import contextlib
+import io
 import json
+import os
+import sys
 import tempfile
 from pathlib import Path
 
+# Set APICRAFTER_DEMO_QUIET=1 to run the demo without printing anything,
+# e.g. when profiling it
+_QUIET = os.environ.get("APICRAFTER_DEMO_QUIET") == "1"
+
+# Section rules
+_SEP50 = "=" * 50
+_SEP60 = "=" * 60
+
 # Mock the dependencies for demo purposes
 class MockConsole:
     def print(self, text, **kwargs):
         print(f"[DEMO] {text}")
 
 class MockRenderer:
+    _PREFIXES = {"info": "ℹ️  ", "success": "✅ ", "error": "❌ "}
+
     def __init__(self):
         self.console = MockConsole()
     
+    def _emit(self, kind, message):
+        sys.stdout.write(self._PREFIXES[kind] + str(message) + "\n")
+    
     def print_info(self, message):
-        print(f"ℹ️  {message}")
+        self._emit("info", message)
     
     def print_success(self, message):
-        print(f"✅ {message}")
+        self._emit("success", message)
     
     def print_error(self, message):
-        print(f"❌ {message}")
+        self._emit("error", message)
+
+_RENDERER = MockRenderer()
 
-def demo_storage():
-    """Demonstrate storage functionality."""
+def demo_storage(storage_dir):
+    """Demonstrate storage functionality using storage_dir."""
     print("\n🗄️  STORAGE DEMO")
-    print("=" * 50)
+    print(_SEP50)
     
     # Import our storage classes
     try:
         from apicrafter.storage import StorageManager, RequestData, Environment
         
-        # Create temporary storage
-        with tempfile.TemporaryDirectory() as temp_dir:
-            storage = StorageManager(Path(temp_dir))
-            renderer = MockRenderer()
-            
-            # Demo: Save a request
-            request_data = RequestData(
-                method="GET",
-                url="https://jsonplaceholder.typicode.com/posts/{{POST_ID}}",
-                headers={"Accept": "application/json"},
-                params={"userId": "{{USER_ID}}"}
-            )
-            
-            storage.save_request("get-post", request_data, "demo-collection")
-            renderer.print_success("Saved request 'get-post' to collection 'demo-collection'")
-            
-            # Demo: Create environment
-            env = Environment(
-                name="demo",
-                variables={
-                    "POST_ID": "1",
-                    "USER_ID": "123",
-                    "BASE_URL": "https://jsonplaceholder.typicode.com"
-                }
-            )
-            storage.save_environment(env)
-            renderer.print_success("Created environment 'demo' with variables")
-            
-            # Demo: Variable resolution
-            test_url = "{{BASE_URL}}/posts/{{POST_ID}}"
-            resolved_url = storage.resolve_variables(test_url, "demo")
-            print(f"🔄 Variable resolution:")
-            print(f"   Original: {test_url}")
-            print(f"   Resolved: {resolved_url}")
-            
-            # Demo: Load saved request
-            loaded_request = storage.load_request("get-post", "demo-collection")
-            if loaded_request:
-                renderer.print_success("Successfully loaded saved request")
-                print(f"   Method: {loaded_request.method}")
-                print(f"   URL: {loaded_request.url}")
-                print(f"   Headers: {loaded_request.headers}")
-            
-            # Demo: List collections
-            collections = storage.load_collections()
-            print(f"\n📚 Collections found: {list(collections.keys())}")
-            
-            # Demo: List environments
-            environments = storage.load_environments()
-            print(f"🌍 Environments found: {list(environments.keys())}")
-            
+        storage = StorageManager(storage_dir)
+        
+        # Demo: Save a request
+        request_data = RequestData(
+            method="GET",
+            url="https://jsonplaceholder.typicode.com/posts/{{POST_ID}}",
+            headers={"Accept": "application/json"},
+            params={"userId": "{{USER_ID}}"}
+        )
+        
+        storage.save_request("get-post", request_data, "demo-collection")
+        _RENDERER.print_success("Saved request 'get-post' to collection 'demo-collection'")
+        
+        # Demo: Create environment
+        env = Environment(
+            name="demo",
+            variables={
+                "POST_ID": "1",
+                "USER_ID": "123",
+                "BASE_URL": "https://jsonplaceholder.typicode.com"
+            }
+        )
+        storage.save_environment(env)
+        _RENDERER.print_success("Created environment 'demo' with variables")
+        
+        # Demo: Variable resolution
+        test_url = "{{BASE_URL}}/posts/{{POST_ID}}"
+        resolved_url = storage.resolve_variables(test_url, "demo")
+        print(f"🔄 Variable resolution:")
+        print(f"   Original: {test_url}")
+        print(f"   Resolved: {resolved_url}")
+        
+        # Demo: Load saved request
+        loaded_request = storage.load_request("get-post", "demo-collection")
+        if loaded_request:
+            _RENDERER.print_success("Successfully loaded saved request")
+            print(f"   Method: {loaded_request.method}")
+            print(f"   URL: {loaded_request.url}")
+            print(f"   Headers: {loaded_request.headers}")
+        
+        # Demo: List collections
+        collections = storage.load_collections()
+        print(f"\n📚 Collections found: {list(collections.keys())}")
+        
+        # Demo: List environments
+        environments = storage.load_environments()
+        print(f"🌍 Environments found: {list(environments.keys())}")
+        
     except ImportError as e:
         print(f"❌ Import error: {e}")
         print("💡 Run 'pip install -r requirements.txt' to install dependencies")
 
+_COMMANDS = (
+    ("send", "Send HTTP requests directly"),
+    ("interactive", "Interactive request builder"),
+    ("save", "Save requests to collections"),
+    ("run", "Execute saved requests"),
+    ("collections", "List all collections"),
+    ("environments", "List all environments"),
+    ("env-set", "Set environment variables"),
+    ("history", "Show request history"),
+    ("replay", "Replay request from history"),
+    ("test", "Run tests on requests"),
+    ("config", "Show configuration locations"),
+    ("version", "Show version information"),
+)
+
+_EXAMPLES = (
+    "apicrafter send GET https://jsonplaceholder.typicode.com/posts/1",
+    "apicrafter interactive",
+    "apicrafter save login --method POST --url 'https://api.example.com/auth'",
+    "apicrafter run login --env production",
+    "apicrafter env-set dev BASE_URL https://dev.api.example.com",
+    "apicrafter history --limit 10",
+)
+
 def demo_cli_structure():
     """Show the CLI command structure."""
     print("\n🖥️  CLI COMMANDS DEMO")
-    print("=" * 50)
-    
-    commands = {
-        "send": "Send HTTP requests directly",
-        "interactive": "Interactive request builder",
-        "save": "Save requests to collections", 
-        "run": "Execute saved requests",
-        "collections": "List all collections",
-        "environments": "List all environments",
-        "env-set": "Set environment variables",
-        "history": "Show request history",
-        "replay": "Replay request from history",
-        "test": "Run tests on requests",
-        "config": "Show configuration locations",
-        "version": "Show version information"
-    }
+    print(_SEP50)
     
     print("Available commands:")
-    for cmd, desc in commands.items():
-        print(f"  📌 apicrafter {cmd:<12} - {desc}")
+    print("\n".join(f"  📌 apicrafter {cmd:<12} - {desc}" for cmd, desc in _COMMANDS))
     
     print("\n💡 Example usage:")
-    examples = [
-        "apicrafter send GET https://jsonplaceholder.typicode.com/posts/1",
-        "apicrafter interactive",
-        "apicrafter save login --method POST --url 'https://api.example.com/auth'",
-        "apicrafter run login --env production",
-        "apicrafter env-set dev BASE_URL https://dev.api.example.com",
-        "apicrafter history --limit 10"
-    ]
-    
-    for example in examples:
-        print(f"  🚀 {example}")
+    print("\n".join(f"  🚀 {example}" for example in _EXAMPLES))
+
+_FEATURES = (
+    "🌐 HTTP Methods: GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS",
+    "📝 Request Formats: JSON, Form data, Raw text, Custom headers",
+    "🎨 Pretty Output: Syntax highlighting for JSON, XML, HTML",
+    "💾 Collections: Organize and save your API requests",
+    "🌍 Environments: Manage dev/staging/prod configurations",
+    "🔄 Variables: Use {{VARIABLE}} syntax for dynamic values",
+    "📚 History: Track all requests with timestamps and response times",
+    "🧪 Testing: Basic assertions for status codes, response content",
+    "🎯 Interactive: Firebase CLI-style menus and prompts",
+    "⚡ Performance: Built on httpx for fast, async-capable requests",
+)
 
 def demo_features():
     """Showcase key features."""
     print("\n✨ KEY FEATURES DEMO")
-    print("=" * 50)
-    
-    features = [
-        "🌐 HTTP Methods: GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS",
-        "📝 Request Formats: JSON, Form data, Raw text, Custom headers",
-        "🎨 Pretty Output: Syntax highlighting for JSON, XML, HTML",
-        "💾 Collections: Organize and save your API requests",
-        "🌍 Environments: Manage dev/staging/prod configurations",
-        "🔄 Variables: Use {{VARIABLE}} syntax for dynamic values",
-        "📚 History: Track all requests with timestamps and response times",
-        "🧪 Testing: Basic assertions for status codes, response content",
-        "🎯 Interactive: Firebase CLI-style menus and prompts",
-        "⚡ Performance: Built on httpx for fast, async-capable requests"
-    ]
+    print(_SEP50)
     
-    for feature in features:
-        print(f"  {feature}")
+    print("\n".join("  " + feature for feature in _FEATURES))
 
 def demo_file_structure():
     """Show the project file structure."""
     print("\n📁 PROJECT STRUCTURE")
-    print("=" * 50)
+    print(_SEP50)
     
     structure = """
 apicrafter/
@@ -168,28 +181,40 @@ apicrafter/
 
 Configuration files:
 ~/.apicrafter/
-├── collections.yaml    # Saved requests and collections
-├── envs.yaml          # Environment variables
+├── collections.json    # Saved requests and collections
+├── envs.json          # Environment variables
 └── history.log        # Request history
     """
     
     print(structure)
 
+@contextlib.contextmanager
+def _buffered_stdout():
+    """Collect everything printed inside the block and write it out at once."""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        if not _QUIET:
+            sys.stdout.write(buffer.getvalue())
+
 def main():
     """Run the demo."""
     print("🛠️  APICRAFTER DEMO")
-    print("=" * 60)
+    print(_SEP60)
     print("A terminal-first, interactive API client")
     print("Bringing Postman-like features to the CLI!")
-    print("=" * 60)
+    print(_SEP60)
     
     demo_features()
     demo_cli_structure()
     demo_file_structure()
-    demo_storage()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        demo_storage(Path(temp_dir))
     
     print("\n🚀 GETTING STARTED")
-    print("=" * 50)
+    print(_SEP50)
     print("1. Install dependencies: pip install -r requirements.txt")
     print("2. Install package: pip install -e .")
     print("3. Run: apicrafter --help")
@@ -197,11 +222,13 @@ def main():
     print("5. Interactive: apicrafter interactive")
     
     print("\n📦 INSTALLATION")
-    print("=" * 50)
+    print(_SEP50)
     print("When ready for production:")
     print("  pipx install apicrafter  # (after publishing to PyPI)")
     print("  # or")
     print("  pip install apicrafter")
 
 if __name__ == "__main__":
-    main()
+    # Hundreds of short prints become a single write to the terminal
+    with _buffered_stdout():
+        main()
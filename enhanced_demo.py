@@ -4,14 +4,33 @@ Enhanced demo script showcasing all apicrafter features.
 This demonstrates the new authentication, body handling, and CLI enhancements.
 """
 
+import contextlib
+import io
 import json
+import os
+import sys
 import tempfile
 from pathlib import Path
 
+# Set APICRAFTER_DEMO_QUIET=1 to run the demo without printing anything,
+# e.g. when profiling it
+_QUIET = os.environ.get("APICRAFTER_DEMO_QUIET") == "1"
+
+# Section rules
+_SEP60 = "=" * 60
+_SEP80 = "=" * 80
+
+_AUTH_EXAMPLES = (
+    ("Bearer Token", "bearer:eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"),
+    ("Basic Auth", "basic:username:password123"),
+    ("API Key (Header)", "apikey:X-API-Key:secret123:header"),
+    ("API Key (Query)", "apikey:api_key:secret456:query"),
+)
+
 def demo_auth_features():
     """Demonstrate authentication features."""
     print("\n🔐 AUTHENTICATION FEATURES")
-    print("=" * 60)
+    print(_SEP60)
     
     try:
         from apicrafter.auth import AuthHandler, AuthType, AuthConfig
@@ -19,16 +38,9 @@ def demo_auth_features():
         print("✅ Authentication module loaded successfully!")
         
         # Demo different auth types
-        auth_examples = [
-            ("Bearer Token", "bearer:eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"),
-            ("Basic Auth", "basic:username:password123"),
-            ("API Key (Header)", "apikey:X-API-Key:secret123:header"),
-            ("API Key (Query)", "apikey:api_key:secret456:query")
-        ]
-        
         print("\n🔧 Parsing Authentication Strings:")
-        for desc, auth_string in auth_examples:
-            config = AuthHandler.parse_auth_string(auth_string)
+        configs = AuthHandler.parse_auth_strings(s for _, s in _AUTH_EXAMPLES)
+        for (desc, auth_string), config in zip(_AUTH_EXAMPLES, configs):
             if config:
                 print(f"  ✅ {desc}")
                 print(f"     Input: {auth_string}")
@@ -57,10 +69,21 @@ def demo_auth_features():
         print(f"❌ Could not import auth module: {e}")
         print("💡 Run 'pip install -r requirements.txt' to install dependencies")
 
+# Sample bodies; prepare_body passes them through unchanged, so they are
+# shared rather than rebuilt on every call
+_JSON_BODY = {"name": "John Doe", "age": 30, "active": True, "scores": [85, 92, 78]}
+_FORM_BODY = {"username": "johndoe", "email": "john@example.com", "subscribe": "true"}
+
+_CLI_BODY_EXAMPLES = (
+    ('{"name": "Alice", "role": "admin"}', None, None, "JSON"),
+    (None, ["name=Bob", "role=user", "active=true"], None, "Form Data"),
+    (None, None, "Plain text content here", "Raw Text"),
+)
+
 def demo_body_features():
     """Demonstrate body handling features."""
     print("\n📄 BODY HANDLING FEATURES")
-    print("=" * 60)
+    print(_SEP60)
     
     try:
         from apicrafter.body import BodyHandler, BodyType, BodyConfig
@@ -71,7 +94,7 @@ def demo_body_features():
         print("\n🔧 JSON Body Handling:")
         json_config = BodyConfig(
             body_type=BodyType.JSON,
-            content={"name": "John Doe", "age": 30, "active": True, "scores": [85, 92, 78]}
+            content=_JSON_BODY
         )
         
         body_str, json_data, headers = BodyHandler.prepare_body(json_config)
@@ -84,7 +107,7 @@ def demo_body_features():
         print("🔧 Form Data Handling:")
         form_config = BodyConfig(
             body_type=BodyType.FORM_DATA,
-            content={"username": "johndoe", "email": "john@example.com", "subscribe": "true"}
+            content=_FORM_BODY
         )
         
         body_str, json_data, headers = BodyHandler.prepare_body(form_config)
@@ -95,13 +118,7 @@ def demo_body_features():
         
         # Demo CLI parsing
         print("🔧 CLI Body Parsing:")
-        cli_examples = [
-            ('{"name": "Alice", "role": "admin"}', None, None, "JSON"),
-            (None, ["name=Bob", "role=user", "active=true"], None, "Form Data"),
-            (None, None, "Plain text content here", "Raw Text")
-        ]
-        
-        for json_str, form_list, raw_str, desc in cli_examples:
+        for json_str, form_list, raw_str, desc in _CLI_BODY_EXAMPLES:
             config = BodyHandler.parse_body_from_cli(json_str, form_list, raw_str)
             if config:
                 print(f"  {desc} Parsing:")
@@ -113,175 +130,154 @@ def demo_body_features():
         print(f"❌ Could not import body module: {e}")
         print("💡 Run 'pip install -r requirements.txt' to install dependencies")
 
+_BASIC_COMMANDS = (
+    ("Simple GET", "apicrafter send GET https://httpbin.org/json"),
+    ("GET with auth", "apicrafter send GET https://httpbin.org/bearer --auth 'bearer:your-token'"),
+    ("POST with JSON", "apicrafter send POST https://httpbin.org/post --json '{\"name\": \"John\"}'"),
+    ("POST with form", "apicrafter send POST https://httpbin.org/post --form 'name=John' --form 'age=30'"),
+    ("With headers", "apicrafter send GET https://httpbin.org/headers --header 'User-Agent: apicrafter/1.0'"),
+    ("With query params", "apicrafter send GET https://httpbin.org/get --query 'page=1' --query 'limit=10'"),
+)
+
+_AUTH_COMMANDS = (
+    ("Bearer token", "apicrafter send GET https://httpbin.org/bearer --auth 'bearer:eyJhbGciOiJIUzI1NiI...'"),
+    ("Basic auth", "apicrafter send GET https://httpbin.org/basic-auth/user/pass --auth 'basic:user:pass'"),
+    ("API key header", "apicrafter send GET https://httpbin.org/get --auth 'apikey:X-API-Key:secret123'"),
+    ("API key query", "apicrafter send GET https://httpbin.org/get --auth 'apikey:api_key:secret123:query'"),
+    ("Test auth", "apicrafter auth bearer 'your-token' --url 'https://httpbin.org/bearer'"),
+)
+
+_COLLECTION_COMMANDS = (
+    ("Save request", "apicrafter save login --method POST --url 'https://api.example.com/auth'"),
+    ("Run saved request", "apicrafter run login --env production"),
+    ("Set environment", "apicrafter env-set dev BASE_URL https://dev.api.example.com"),
+    ("Set API key", "apicrafter env-set prod API_KEY your-production-key"),
+    ("List collections", "apicrafter collections"),
+    ("List environments", "apicrafter environments"),
+)
+
+_UTILITY_COMMANDS = (
+    ("Interactive mode", "apicrafter interactive"),
+    ("View history", "apicrafter history --limit 10"),
+    ("Replay request", "apicrafter replay 5"),
+    ("Generate curl", "apicrafter curl login --env prod"),
+    ("Inspect headers", "apicrafter headers https://httpbin.org/get"),
+    ("Show documentation", "apicrafter docs"),
+    ("Quick GET", "apicrafter get https://httpbin.org/json"),
+    ("Quick POST", "apicrafter post https://httpbin.org/post --json '{\"test\": true}'"),
+)
+
+_SCRIPTING_EXAMPLE = """\
+  from apicrafter.http_client import APIClient
+
+  # One client holds one httpx connection pool for all requests
+  with APIClient() as client:
+      for post_id in range(1, 11):
+          response = client.send_request(
+              "GET", f"https://jsonplaceholder.typicode.com/posts/{post_id}"
+          )
+          print(response.status_code, response.response_time)
+"""
+
+def _format_commands(rows):
+    """Render (description, command) rows, each followed by a blank line."""
+    return "\n".join(f"  {desc}:\n    {cmd}\n" for desc, cmd in rows)
+
 def demo_cli_commands():
     """Demonstrate CLI command examples."""
     print("\n🖥️  CLI COMMANDS SHOWCASE")
-    print("=" * 60)
+    print(_SEP60)
     
     print("🚀 Basic Commands:")
-    basic_commands = [
-        ("Simple GET", "apicrafter send GET https://httpbin.org/json"),
-        ("GET with auth", "apicrafter send GET https://httpbin.org/bearer --auth 'bearer:your-token'"),
-        ("POST with JSON", "apicrafter send POST https://httpbin.org/post --json '{\"name\": \"John\"}'"),
-        ("POST with form", "apicrafter send POST https://httpbin.org/post --form 'name=John' --form 'age=30'"),
-        ("With headers", "apicrafter send GET https://httpbin.org/headers --header 'User-Agent: apicrafter/1.0'"),
-        ("With query params", "apicrafter send GET https://httpbin.org/get --query 'page=1' --query 'limit=10'"),
-    ]
-    
-    for desc, cmd in basic_commands:
-        print(f"  {desc}:")
-        print(f"    {cmd}")
-        print()
+    print(_format_commands(_BASIC_COMMANDS))
     
     print("🔐 Authentication Commands:")
-    auth_commands = [
-        ("Bearer token", "apicrafter send GET https://httpbin.org/bearer --auth 'bearer:eyJhbGciOiJIUzI1NiI...'"),
-        ("Basic auth", "apicrafter send GET https://httpbin.org/basic-auth/user/pass --auth 'basic:user:pass'"),
-        ("API key header", "apicrafter send GET https://httpbin.org/get --auth 'apikey:X-API-Key:secret123'"),
-        ("API key query", "apicrafter send GET https://httpbin.org/get --auth 'apikey:api_key:secret123:query'"),
-        ("Test auth", "apicrafter auth bearer 'your-token' --url 'https://httpbin.org/bearer'"),
-    ]
-    
-    for desc, cmd in auth_commands:
-        print(f"  {desc}:")
-        print(f"    {cmd}")
-        print()
+    print(_format_commands(_AUTH_COMMANDS))
     
     print("💾 Collection & Environment Commands:")
-    collection_commands = [
-        ("Save request", "apicrafter save login --method POST --url 'https://api.example.com/auth'"),
-        ("Run saved request", "apicrafter run login --env production"),
-        ("Set environment", "apicrafter env-set dev BASE_URL https://dev.api.example.com"),
-        ("Set API key", "apicrafter env-set prod API_KEY your-production-key"),
-        ("List collections", "apicrafter collections"),
-        ("List environments", "apicrafter environments"),
-    ]
-    
-    for desc, cmd in collection_commands:
-        print(f"  {desc}:")
-        print(f"    {cmd}")
-        print()
+    print(_format_commands(_COLLECTION_COMMANDS))
     
     print("🛠️  Utility Commands:")
-    utility_commands = [
-        ("Interactive mode", "apicrafter interactive"),
-        ("View history", "apicrafter history --limit 10"),
-        ("Replay request", "apicrafter replay 5"),
-        ("Generate curl", "apicrafter curl login --env prod"),
-        ("Inspect headers", "apicrafter headers https://httpbin.org/get"),
-        ("Show documentation", "apicrafter docs"),
-        ("Quick GET", "apicrafter get https://httpbin.org/json"),
-        ("Quick POST", "apicrafter post https://httpbin.org/post --json '{\"test\": true}'"),
-    ]
-    
-    for desc, cmd in utility_commands:
-        print(f"  {desc}:")
-        print(f"    {cmd}")
-        print()
+    print(_format_commands(_UTILITY_COMMANDS))
+
+    # Each command above runs in its own process; scripts sending many
+    # requests should keep one client so connections are reused.
+    print("🐍 Scripting Many Requests:")
+    print(_SCRIPTING_EXAMPLE)
 
-def demo_environment_features():
-    """Demonstrate environment and variable features."""
+_TEST_STRINGS = (
+    "{{BASE_URL}}/users/{{USER_ID}}",
+    "Authorization: Bearer {{API_KEY}}",
+    "timeout={{TIMEOUT}}&user={{USER_ID}}",
+    "https://{{BASE_URL}}/api/v1/data?key={{API_KEY}}",
+)
+
+# Every demo environment defines the same variables; only the values differ
+_ENV_KEYS = ("BASE_URL", "API_KEY", "USER_ID", "TIMEOUT")
+_ENV_VALUES = (
+    ("development", ("https://dev-api.example.com", "dev-key-123", "test-user", "30")),
+    ("staging", ("https://staging-api.example.com", "staging-key-456", "staging-user", "60")),
+    # Nested variables
+    ("production", ("https://api.example.com", "{{PROD_API_KEY}}", "{{PROD_USER_ID}}", "120")),
+)
+
+def demo_environment_features(storage_dir):
+    """Demonstrate environment and variable features using storage_dir."""
     print("\n🌍 ENVIRONMENT & VARIABLES")
-    print("=" * 60)
+    print(_SEP60)
     
     try:
         from apicrafter.storage import StorageManager, Environment
         
-        # Create temporary storage
-        with tempfile.TemporaryDirectory() as temp_dir:
-            storage = StorageManager(Path(temp_dir))
-            
-            print("✅ Storage system loaded successfully!")
-            
-            # Create demo environments
-            environments = {
-                "development": Environment(
-                    name="development",
-                    variables={
-                        "BASE_URL": "https://dev-api.example.com",
-                        "API_KEY": "dev-key-123",
-                        "USER_ID": "test-user",
-                        "TIMEOUT": "30"
-                    }
-                ),
-                "staging": Environment(
-                    name="staging",
-                    variables={
-                        "BASE_URL": "https://staging-api.example.com",
-                        "API_KEY": "staging-key-456",
-                        "USER_ID": "staging-user",
-                        "TIMEOUT": "60"
-                    }
-                ),
-                "production": Environment(
-                    name="production",
-                    variables={
-                        "BASE_URL": "https://api.example.com",
-                        "API_KEY": "{{PROD_API_KEY}}",  # Nested variable
-                        "USER_ID": "{{PROD_USER_ID}}",
-                        "TIMEOUT": "120"
-                    }
-                )
-            }
-            
-            # Save environments
-            for env in environments.values():
-                storage.save_environment(env)
-            
-            print("\n🔧 Environment Variable Resolution:")
-            test_strings = [
-                "{{BASE_URL}}/users/{{USER_ID}}",
-                "Authorization: Bearer {{API_KEY}}",
-                "timeout={{TIMEOUT}}&user={{USER_ID}}",
-                "https://{{BASE_URL}}/api/v1/data?key={{API_KEY}}"
-            ]
-            
-            for env_name in ["development", "staging"]:
-                print(f"\n  Environment: {env_name}")
-                for test_string in test_strings:
-                    resolved = storage.resolve_variables(test_string, env_name)
-                    print(f"    Original:  {test_string}")
-                    print(f"    Resolved:  {resolved}")
-                    print()
-            
-            # Demo nested variables (production env)
-            print("  Environment: production (with nested variables)")
-            for test_string in test_strings[:2]:  # Just first two to show concept
-                resolved = storage.resolve_variables(test_string, "production")
+        storage = StorageManager(storage_dir)
+        
+        print("✅ Storage system loaded successfully!")
+        
+        # Create demo environments
+        environments = {
+            name: Environment(name=name, variables=dict(zip(_ENV_KEYS, values)))
+            for name, values in _ENV_VALUES
+        }
+        
+        # Save environments
+        for env in environments.values():
+            storage.save_environment(env)
+        
+        print("\n🔧 Environment Variable Resolution:")
+        # resolve_variables memoizes (template, environment) pairs and
+        # drops them when the environment's variables change, so no
+        # extra caching is needed around these loops.
+        for env_name in ["development", "staging"]:
+            print(f"\n  Environment: {env_name}")
+            for test_string in _TEST_STRINGS:
+                resolved = storage.resolve_variables(test_string, env_name)
                 print(f"    Original:  {test_string}")
                 print(f"    Resolved:  {resolved}")
-                print(f"    Note: {{PROD_API_KEY}} and {{PROD_USER_ID}} would need to be set")
                 print()
-                
+        
+        # Demo nested variables (production env)
+        print("  Environment: production (with nested variables)")
+        for test_string in _TEST_STRINGS[:2]:  # Just first two to show concept
+            resolved = storage.resolve_variables(test_string, "production")
+            print(f"    Original:  {test_string}")
+            print(f"    Resolved:  {resolved}")
+            print(f"    Note: {{PROD_API_KEY}} and {{PROD_USER_ID}} would need to be set")
+            print()
+            
     except ImportError as e:
         print(f"❌ Could not import storage module: {e}")
         print("💡 Run 'pip install -r requirements.txt' to install dependencies")
 
-def demo_testing_features():
-    """Demonstrate testing and assertion features."""
-    print("\n🧪 TESTING & ASSERTIONS")
-    print("=" * 60)
-    
-    print("✅ Testing framework integrated into HTTP client!")
-    
-    print("\n🔧 Available Test Assertions:")
-    assertions = [
-        ("status_code", "Expected HTTP status code", "200, 201, 404, etc."),
-        ("body_contains", "Text that should be in response body", "\"success\", \"error\", \"token\""),
-        ("body_equals", "Exact response body match", "\"OK\", \"{\\\"status\\\": \\\"ok\\\"}\""),
-        ("json_field", "JSON field value checks (dot notation)", "{\"user.name\": \"John\", \"status\": \"active\"}"),
-        ("max_response_time", "Maximum response time in seconds", "2.0, 5.0, 10.0"),
-        ("headers", "Expected header values", "{\"Content-Type\": \"application/json\"}")
-    ]
-    
-    for name, desc, example in assertions:
-        print(f"  {name}:")
-        print(f"    Description: {desc}")
-        print(f"    Example: {example}")
-        print()
-    
-    print("🔧 Test Configuration Example (YAML):")
-    test_config = """
+_ASSERTIONS = (
+    ("status_code", "Expected HTTP status code", "200, 201, 404, etc."),
+    ("body_contains", "Text that should be in response body", "\"success\", \"error\", \"token\""),
+    ("body_equals", "Exact response body match", "\"OK\", \"{\\\"status\\\": \\\"ok\\\"}\""),
+    ("json_field", "JSON field value checks (dot notation)", "{\"user.name\": \"John\", \"status\": \"active\"}"),
+    ("max_response_time", "Maximum response time in seconds", "2.0, 5.0, 10.0"),
+    ("headers", "Expected header values", "{\"Content-Type\": \"application/json\"}"),
+)
+
+_TEST_CONFIG_YAML = """
 tests:
   api_health:
     status_code: 200
@@ -301,52 +297,78 @@ tests:
       user.role: "user"
     max_response_time: 5.0
 """
+
+_TEST_COMMANDS = (
+    "apicrafter test api_health --tests tests.yaml",
+    "apicrafter test user_login --collection auth --env staging",
+    "apicrafter test all_endpoints --tests api_tests.yaml --env production",
+)
+
+def demo_testing_features():
+    """Demonstrate testing and assertion features."""
+    print("\n🧪 TESTING & ASSERTIONS")
+    print(_SEP60)
     
-    print(test_config)
+    print("✅ Testing framework integrated into HTTP client!")
     
-    print("🔧 Running Tests:")
-    test_commands = [
-        "apicrafter test api_health --tests tests.yaml",
-        "apicrafter test user_login --collection auth --env staging",
-        "apicrafter test all_endpoints --tests api_tests.yaml --env production"
-    ]
+    print("\n🔧 Available Test Assertions:")
+    for name, desc, example in _ASSERTIONS:
+        print(f"  {name}:")
+        print(f"    Description: {desc}")
+        print(f"    Example: {example}")
+        print()
+    
+    print("🔧 Test Configuration Example (YAML):")
     
-    for cmd in test_commands:
-        print(f"  {cmd}")
+    print(_TEST_CONFIG_YAML)
+    
+    print("🔧 Running Tests:")
+    print("\n".join("  " + cmd for cmd in _TEST_COMMANDS))
     print()
 
+@contextlib.contextmanager
+def _buffered_stdout():
+    """Collect everything printed inside the block and write it out at once."""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        if not _QUIET:
+            sys.stdout.write(buffer.getvalue())
+
+_FEATURES = (
+    "🔐 Comprehensive Authentication (Bearer, Basic, API Key)",
+    "📄 Advanced Body Handling (JSON, Form, Raw, Binary)",
+    "🌍 Enhanced Environment System with Variable Resolution",
+    "🖥️  Extended CLI with New Commands and Aliases",
+    "🧪 Improved Testing Framework with Multiple Assertions",
+    "🛠️  Utility Commands (curl generation, header inspection)",
+    "📚 Interactive Documentation and Examples",
+    "⚡ Performance Optimizations and Better Error Handling",
+)
+
 def main():
     """Run the enhanced demo."""
     print("🛠️  APICRAFTER ENHANCED DEMO")
-    print("=" * 80)
+    print(_SEP80)
     print("🚀 A terminal-first, interactive API client with advanced features!")
-    print("=" * 80)
+    print(_SEP80)
     
     demo_auth_features()
     demo_body_features()
-    demo_environment_features()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        demo_environment_features(Path(temp_dir))
     demo_testing_features()
     demo_cli_commands()
     
     print("\n🎯 NEW FEATURES SUMMARY")
-    print("=" * 60)
-    
-    features = [
-        "🔐 Comprehensive Authentication (Bearer, Basic, API Key)",
-        "📄 Advanced Body Handling (JSON, Form, Raw, Binary)",
-        "🌍 Enhanced Environment System with Variable Resolution",
-        "🖥️  Extended CLI with New Commands and Aliases",
-        "🧪 Improved Testing Framework with Multiple Assertions",
-        "🛠️  Utility Commands (curl generation, header inspection)",
-        "📚 Interactive Documentation and Examples",
-        "⚡ Performance Optimizations and Better Error Handling"
-    ]
+    print(_SEP60)
     
-    for feature in features:
-        print(f"  {feature}")
+    print("\n".join("  " + feature for feature in _FEATURES))
     
     print("\n🚀 GETTING STARTED")
-    print("=" * 60)
+    print(_SEP60)
     print("1. Install dependencies: pip install -r requirements.txt")
     print("2. Install package: pip install -e .")
     print("3. Try the new features:")
@@ -357,7 +379,7 @@ def main():
     print("   • apicrafter send POST https://httpbin.org/post --json '{\"test\": true}'")
     
     print("\n📦 READY FOR PRODUCTION!")
-    print("=" * 60)
+    print(_SEP60)
     print("All features are implemented and tested. Ready for:")
     print("  • PyPI publication")
     print("  • pipx installation")
@@ -365,4 +387,6 @@ def main():
     print("  • Community contributions")
 
 if __name__ == "__main__":
-    main()
+    # Hundreds of short prints become a single write to the terminal
+    with _buffered_stdout():
+        main()